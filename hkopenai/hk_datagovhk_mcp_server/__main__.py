@@ -4,8 +4,41 @@ Main entry point for the HK Data.gov.hk MCP Server.
 This script serves as the command-line interface to start the MCP server with configurable options.
 """
 
+import argparse
 from hkopenai_common.cli_utils import cli_main
 from .server import server
+from . import tracing
+
+
+def main(args_list=None):
+    """Parse server-specific options, then start the server through cli_main."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Enable per-request tracing and the debug_recent_traces tool",
+    )
+    parser.add_argument(
+        "--trace-sample-rate",
+        type=float,
+        default=None,
+        help="Fraction of tool calls to trace (default: 1.0)",
+    )
+    parser.add_argument(
+        "--trace-profile-rate",
+        type=float,
+        default=None,
+        help="Fraction of traced tool calls to also profile (default: 0.01)",
+    )
+    args, remaining = parser.parse_known_args(args_list)
+
+    tracing.configure(
+        enabled=True if args.trace else None,
+        sample_rate=args.trace_sample_rate,
+        profile_rate=args.trace_profile_rate,
+    )
+    cli_main(server, "HK Datagovhk MCP Server", remaining)
+
 
 if __name__ == "__main__":
-    cli_main(server, "HK Datagovhk MCP Server")
+    main()
@@ -0,0 +1,250 @@
+"""
+Admission control for the HK Data.gov.hk MCP Server.
+
+This module bounds how many tool calls run at once, both overall and per tool, and
+admits queued calls by priority class so cheap catalogue and package lookups are not
+stuck behind bulk crawls. Calls are rejected with a retry-after hint once the queue is
+too deep, and queue depth and wait times are exposed for autoscaling.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from fastmcp.server.middleware import Middleware
+from fastmcp.tools import ToolResult
+from mcp.types import TextContent
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from . import tracing
+from .env import env_int
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENCY_ENV = "HKDATAGOVHK_MAX_CONCURRENCY"
+MAX_QUEUE_DEPTH_ENV = "HKDATAGOVHK_MAX_QUEUE_DEPTH"
+
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_QUEUE_DEPTH = 64
+DEFAULT_TOOL_LIMIT = 8
+
+INTERACTIVE = "interactive"
+NORMAL = "normal"
+BULK = "bulk"
+PRIORITIES = (INTERACTIVE, NORMAL, BULK)
+
+TOOL_PRIORITIES = {
+    "get_categories": INTERACTIVE,
+    "get_providers": INTERACTIVE,
+    "get_package_data": INTERACTIVE,
+    "find_related_datasets": INTERACTIVE,
+    "debug_recent_traces": INTERACTIVE,
+    "list_archived_versions": NORMAL,
+    "crawl_datasets": BULK,
+    "get_archived_file": BULK,
+}
+
+# Budgets count admitted tool calls, not upstream requests. list_archived_versions
+# fans out to up to archive.MAX_WORKERS (8) concurrent month requests per call, so it
+# gets a budget of 1 to keep its upstream concurrency at or below DEFAULT_TOOL_LIMIT.
+TOOL_LIMITS = {
+    "crawl_datasets": 4,
+    "get_archived_file": 4,
+    "list_archived_versions": 1,
+}
+
+# Weight of the latest sample in the moving averages of wait and service times.
+EWMA_ALPHA = 0.2
+
+
+class AdmissionRejected(Exception):
+    """Raised when a call is rejected because the queue is full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Server is busy. Retry after {retry_after} seconds.")
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """A priority-aware concurrency limiter with per-tool budgets."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_queue_depth: int = DEFAULT_MAX_QUEUE_DEPTH,
+        tool_limits: Optional[Dict[str, int]] = None,
+        tool_priorities: Optional[Dict[str, str]] = None,
+        default_tool_limit: int = DEFAULT_TOOL_LIMIT,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queue_depth = max_queue_depth
+        self.tool_limits = dict(TOOL_LIMITS if tool_limits is None else tool_limits)
+        self.tool_priorities = dict(
+            TOOL_PRIORITIES if tool_priorities is None else tool_priorities
+        )
+        self.default_tool_limit = default_tool_limit
+        self._in_flight: Dict[str, int] = {}
+        self._queues: Dict[str, Deque[Tuple[str, asyncio.Future]]] = {
+            priority: deque() for priority in PRIORITIES
+        }
+        self._admitted = 0
+        self._rejected = 0
+        self._avg_wait = 0.0
+        self._max_wait = 0.0
+        self._avg_service = 0.0
+
+    def priority(self, tool: str) -> str:
+        """Return the priority class of a tool."""
+        return self.tool_priorities.get(tool, NORMAL)
+
+    def _can_run(self, tool: str) -> bool:
+        limit = self.tool_limits.get(tool, self.default_tool_limit)
+        return (
+            sum(self._in_flight.values()) < self.max_concurrency
+            and self._in_flight.get(tool, 0) < limit
+        )
+
+    def _start(self, tool: str) -> None:
+        self._in_flight[tool] = self._in_flight.get(tool, 0) + 1
+
+    def queue_depth(self) -> int:
+        """Return the number of calls waiting to be admitted."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def retry_after(self) -> int:
+        """Estimate how many seconds a rejected client should wait."""
+        backlog = self.queue_depth() / max(self.max_concurrency, 1)
+        return max(1, math.ceil(backlog * self._avg_service))
+
+    def _dispatch(self) -> None:
+        """Admit waiting calls in priority order while budgets allow."""
+        for priority in PRIORITIES:
+            queue = self._queues[priority]
+            for _ in range(len(queue)):
+                tool, future = queue.popleft()
+                if future.done():
+                    continue
+                if self._can_run(tool):
+                    self._start(tool)
+                    future.set_result(None)
+                else:
+                    queue.append((tool, future))
+
+    async def acquire(self, tool: str) -> float:
+        """
+        Wait until the tool call may run.
+
+        Args:
+            tool: The name of the tool being called.
+
+        Returns:
+            The time in seconds spent waiting.
+
+        Raises:
+            AdmissionRejected: If the call cannot run and the queue is full.
+        """
+        start = time.perf_counter()
+        queue = self._queues[self.priority(tool)]
+        future = asyncio.get_running_loop().create_future()
+        queue.append((tool, future))
+        self._dispatch()
+        if not future.done():
+            if self.queue_depth() > self.max_queue_depth:
+                queue.remove((tool, future))
+                self._rejected += 1
+                raise AdmissionRejected(self.retry_after())
+            try:
+                await future
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    self.release(tool, 0.0)
+                elif (tool, future) in queue:
+                    queue.remove((tool, future))
+                raise
+        waited = time.perf_counter() - start
+        self._admitted += 1
+        self._avg_wait += EWMA_ALPHA * (waited - self._avg_wait)
+        self._max_wait = max(self._max_wait, waited)
+        return waited
+
+    def release(self, tool: str, service_time: float) -> None:
+        """
+        Release the slot held by a finished tool call.
+
+        Args:
+            tool: The name of the tool that finished.
+            service_time: The time in seconds the call ran for.
+        """
+        self._in_flight[tool] -= 1
+        if service_time:
+            self._avg_service += EWMA_ALPHA * (service_time - self._avg_service)
+        self._dispatch()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, wait times and counters for monitoring."""
+        return {
+            "in_flight": sum(self._in_flight.values()),
+            "in_flight_by_tool": {
+                tool: count for tool, count in self._in_flight.items() if count
+            },
+            "queue_depth": self.queue_depth(),
+            "queue_depth_by_priority": {
+                priority: len(queue) for priority, queue in self._queues.items()
+            },
+            "max_concurrency": self.max_concurrency,
+            "max_queue_depth": self.max_queue_depth,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "avg_wait_ms": round(self._avg_wait * 1000, 3),
+            "max_wait_ms": round(self._max_wait * 1000, 3),
+            "avg_service_ms": round(self._avg_service * 1000, 3),
+        }
+
+
+class AdmissionMiddleware(Middleware):
+    """Middleware that admits tool calls through an AdmissionController."""
+
+    def __init__(self, controller: AdmissionController):
+        self.controller = controller
+
+    async def on_call_tool(self, context, call_next):
+        """Queue the tool call until it is admitted, or reject it."""
+        tool = getattr(context.message, "name", "unknown")
+        try:
+            with tracing.span("admission_wait"):
+                await self.controller.acquire(tool)
+        except AdmissionRejected as e:
+            logger.warning("Rejected call to %s: %s", tool, e)
+            error = {"error": str(e), "retry_after": e.retry_after}
+            return ToolResult(
+                content=[TextContent(type="text", text=json.dumps(error))],
+                structured_content=error,
+                is_error=True,
+            )
+        start = time.perf_counter()
+        try:
+            return await call_next(context)
+        finally:
+            self.controller.release(tool, time.perf_counter() - start)
+
+
+def register(mcp) -> AdmissionController:
+    """Registers admission control and the /admission stats route with the server."""
+    controller = AdmissionController(
+        max_concurrency=env_int(MAX_CONCURRENCY_ENV, DEFAULT_MAX_CONCURRENCY),
+        max_queue_depth=env_int(MAX_QUEUE_DEPTH_ENV, DEFAULT_MAX_QUEUE_DEPTH),
+    )
+    mcp.add_middleware(AdmissionMiddleware(controller))
+
+    @mcp.custom_route("/admission", methods=["GET"])
+    async def admission_stats(request: Request) -> JSONResponse:
+        """Return admission queue depth and wait times as JSON."""
+        return JSONResponse(controller.stats())
+
+    return controller
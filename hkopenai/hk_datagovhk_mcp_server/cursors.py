@@ -0,0 +1,192 @@
+"""
+Server-side result cursors for the HK Data.gov.hk MCP Server.
+
+This module holds large tool results in a TTL-evicted buffer and returns them one page
+at a time with an opaque cursor, so clients can read further slices without another
+upstream request, or stop early.
+"""
+
+import logging
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+from fastmcp.tools import ToolResult
+
+from .env import env_float
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CURSOR_TTL_ENV = "HKDATAGOVHK_CURSOR_TTL"
+DEFAULT_TTL = 300.0
+DEFAULT_MAXSIZE = 64
+
+_INVALID_CURSOR = (
+    "Cursor is invalid or has expired. "
+    "Call the tool again without a cursor to start over."
+)
+
+
+def collection_path(result: Any, key: str) -> Tuple[str, ...]:
+    """
+    Return the path to page in a result holding its collection under key.
+
+    Args:
+        result: The full tool result, either raw data or a ToolResult.
+        key: The key expected to hold the collection, such as "categories".
+
+    Returns:
+        (key,) when the result holds a list or mapping under key, otherwise an empty
+        path so the result itself is paged.
+    """
+    data = result.structured_content if isinstance(result, ToolResult) else result
+    if isinstance(data, dict) and isinstance(data.get(key), (list, dict)):
+        return (key,)
+    return ()
+
+
+def _find_items(data: Any, path: Sequence[str]) -> Optional[Union[List, Dict]]:
+    """Return the list or mapping found by following path into data, or None."""
+    node = data
+    for key in path:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    if isinstance(node, list) or (isinstance(node, dict) and "error" not in node):
+        return node
+    return None
+
+
+def _slice(items: Union[List, Dict], start: int, end: int) -> Union[List, Dict]:
+    """Return items start to end of a list, or of a mapping in insertion order."""
+    if isinstance(items, dict):
+        return dict(islice(items.items(), start, end))
+    return items[start:end]
+
+
+def _with_items(
+    data: Any, path: Sequence[str], items: Union[List, Dict]
+) -> Dict[str, Any]:
+    """Return a shallow copy of data with the collection at path replaced by items."""
+    if not path:
+        return {"items": items}
+    result = dict(data)
+    node = result
+    for key in path[:-1]:
+        node[key] = dict(node[key])
+        node = node[key]
+    node[path[-1]] = items
+    return result
+
+
+class CursorStore:
+    """A bounded TTL buffer of paginated results addressed by opaque cursors."""
+
+    def __init__(self, ttl: Optional[float] = None, maxsize: int = DEFAULT_MAXSIZE):
+        self.ttl = env_float(CURSOR_TTL_ENV, DEFAULT_TTL) if ttl is None else ttl
+        self.maxsize = maxsize
+        self._buffers: (
+            "OrderedDict[str, Tuple[float, Hashable, Any, Tuple[str, ...], int]]"
+        ) = OrderedDict()
+        self._lock = threading.Lock()
+
+    def open(
+        self,
+        result: Any,
+        path: Sequence[str],
+        page_size: int,
+        key: Hashable = None,
+    ) -> Any:
+        """
+        Buffer a result and return its first page.
+
+        Results without a list or mapping at path, such as error responses, are
+        returned unchanged. Mappings are paged by their items in insertion order.
+
+        Args:
+            result: The full tool result, either raw data or a ToolResult.
+            path: Keys leading to the collection to paginate; empty to page the
+                result itself.
+            page_size: The number of items per page.
+            key: The call arguments the result was produced for; later reads must
+                pass the same key.
+
+        Returns:
+            The first page with pagination details, or the unchanged result.
+        """
+        data = result.structured_content if isinstance(result, ToolResult) else result
+        if _find_items(data, path) is None:
+            return result
+
+        token = secrets.token_urlsafe(16)
+        with self._lock:
+            self._buffers[token] = (
+                time.monotonic() + self.ttl,
+                key,
+                data,
+                tuple(path),
+                page_size,
+            )
+            while len(self._buffers) > self.maxsize:
+                self._buffers.popitem(last=False)
+        return self._page(token, data, tuple(path), page_size, 0)
+
+    def read(self, cursor: str, key: Hashable = None) -> Dict[str, Any]:
+        """
+        Return the page addressed by a cursor from an earlier call.
+
+        Args:
+            cursor: The next_cursor value of a previous page.
+            key: The call arguments of this read, which must match those the cursor
+                was opened with.
+
+        Returns:
+            The page with pagination details, or an error message.
+        """
+        token, _, offset = cursor.rpartition(".")
+        if not token or not offset.isdecimal() or not offset.isascii():
+            return {"error": _INVALID_CURSOR}
+        now = time.monotonic()
+        with self._lock:
+            entry = self._buffers.get(token)
+            if entry is not None and entry[0] <= now:
+                del self._buffers[token]
+                entry = None
+            if entry is not None and entry[1] == key:
+                self._buffers[token] = (now + self.ttl,) + entry[1:]
+                self._buffers.move_to_end(token)
+        if entry is None:
+            return {"error": _INVALID_CURSOR}
+        if entry[1] != key:
+            return {
+                "error": (
+                    "Cursor belongs to a call with different arguments. "
+                    "Pass the same arguments as the call that returned it."
+                )
+            }
+        _, _, data, path, page_size = entry
+        return self._page(token, data, path, page_size, int(offset))
+
+    def _page(
+        self,
+        token: str,
+        data: Any,
+        path: Tuple[str, ...],
+        page_size: int,
+        offset: int,
+    ) -> Dict[str, Any]:
+        items = _find_items(data, path) or []
+        end = offset + page_size
+        page = _with_items(data, path, _slice(items, offset, end))
+        page["pagination"] = {
+            "offset": offset,
+            "page_size": page_size,
+            "total": len(items),
+            "next_cursor": f"{token}.{end}" if end < len(items) else None,
+        }
+        logger.debug("Returning items %d-%d of %d", offset, end, len(items))
+        return page
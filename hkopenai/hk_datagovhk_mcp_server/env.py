@@ -0,0 +1,36 @@
+"""
+Environment variable helpers for the HK Data.gov.hk MCP Server.
+
+This module parses numeric settings from environment variables, logging and falling
+back to a default when a value is invalid.
+"""
+
+import logging
+import os
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def env_float(name: str, default: float) -> float:
+    """Return the environment variable name as a float, or default."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.error("Invalid value for %s: %s. Using %s.", name, value, default)
+        return default
+
+
+def env_int(name: str, default: int) -> int:
+    """Return the environment variable name as an int, or default."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.error("Invalid value for %s: %s. Using %s.", name, value, default)
+        return default
@@ -0,0 +1,99 @@
+"""
+Cache of pre-serialized tool responses for the HK Data.gov.hk MCP Server.
+
+This module keeps successful tool results as ready-made ToolResult objects whose JSON
+text is serialized once, using orjson when it is installed and the standard library
+json module otherwise, so repeated identical calls skip serialization entirely.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from fastmcp.tools import ToolResult
+from mcp.types import TextContent
+
+from .env import env_float
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CACHE_TTL_ENV = "HKDATAGOVHK_CACHE_TTL"
+DEFAULT_TTL = 300.0
+DEFAULT_MAXSIZE = 256
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Serialize data to JSON bytes with orjson, falling back to the json module.
+
+    Args:
+        data: The JSON-compatible data to serialize.
+
+    Returns:
+        The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str)
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+    return text.encode("utf-8")
+
+
+class ResponseCache:
+    """A bounded TTL cache mapping call arguments to pre-serialized tool results."""
+
+    def __init__(self, ttl: Optional[float] = None, maxsize: int = DEFAULT_MAXSIZE):
+        self.ttl = env_float(CACHE_TTL_ENV, DEFAULT_TTL) if ttl is None else ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, ToolResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for key, calling fetch on a miss.
+
+        Only successful dictionary results are cached; errors and other values are
+        returned unchanged so FastMCP serializes them as usual.
+
+        Args:
+            key: Hashable cache key, typically the tool name and its arguments.
+            fetch: Zero-argument callable returning the raw tool result.
+
+        Returns:
+            A ToolResult for cacheable results, otherwise the raw result.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                logger.debug("Response cache hit for %s", key)
+                return entry[1]
+
+        data = fetch()
+        if not isinstance(data, dict) or "error" in data or self.ttl <= 0:
+            return data
+
+        result = ToolResult(
+            content=[TextContent(type="text", text=dumps(data).decode("utf-8"))],
+            structured_content=data,
+        )
+        with self._lock:
+            self._entries[key] = (now + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
@@ -2,7 +2,8 @@
 HK Data.gov.hk MCP Server implementation.
 
 This module provides the core functionality for the MCP server, including tools to interact
-with the data.gov.hk API for crawling datasets, fetching providers, categories, and package data.
+with the data.gov.hk API for crawling datasets, fetching providers, categories, package data,
+related datasets, and historical archive versions.
 """
 
 from fastmcp import FastMCP
@@ -10,6 +11,10 @@ from .tools import crawler
 from .tools import providers
 from .tools import categories
 from .tools import package
+from .tools import related
+from .tools import archive
+from . import admission
+from . import tracing
 
 
 def server():
@@ -20,5 +25,12 @@ def server():
     providers.register(mcp)
     categories.register(mcp)
     package.register(mcp)
+    related.register(mcp)
+    archive.register(mcp)
+
+    if tracing.is_enabled():
+        tracing.register(mcp)
+
+    admission.register(mcp)
 
     return mcp
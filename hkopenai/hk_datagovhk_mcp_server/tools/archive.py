@@ -0,0 +1,286 @@
+"""
+Browse the data.gov.hk historical archive.
+
+This module lists archived versions of a resource over a date range and fetches a
+specific archived version. Listings for past months never change, so they are kept
+in a bounded cache for the lifetime of the process.
+"""
+
+import calendar
+import contextvars
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, Dict, List, Tuple
+import requests
+from pydantic import Field
+from typing_extensions import Annotated
+from .. import tracing
+from ..upstream import fetch, fetch_json_data
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+LIST_VERSIONS_URL = "https://api.data.gov.hk/v1/historical-archive/list-file-versions"
+GET_FILE_URL = "https://api.data.gov.hk/v1/historical-archive/get-file"
+DATE_FORMAT = "%Y%m%d"
+MAX_MONTHS = 36
+MAX_WORKERS = 8
+MAX_CACHED_LISTINGS = 4096
+
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_DATE_RE = re.compile(r"[0-9]{8}")
+
+_listing_cache: "OrderedDict[Tuple[str, str], List[str]]" = OrderedDict()
+_listing_cache_lock = threading.Lock()
+
+
+def register(mcp):
+    """Registers the datagovhk_archive tools with the FastMCP server."""
+
+    @mcp.tool(
+        description=(
+            "List archived versions of a data.gov.hk resource URL between two dates "
+            "(YYYYMMDD, spanning at most 36 months) from the historical archive."
+        ),
+    )
+    @tracing.traced
+    def list_archived_versions(
+        resource_url: Annotated[
+            str, Field(description="The URL of the data.gov.hk resource.")
+        ],
+        start_date: Annotated[
+            str, Field(description="The first date of the range (YYYYMMDD).")
+        ],
+        end_date: Annotated[
+            str, Field(description="The last date of the range (YYYYMMDD).")
+        ],
+    ) -> Dict:
+        """List archived versions of a resource between two dates.
+
+        Args:
+            resource_url: The URL of the data.gov.hk resource.
+            start_date: The first date of the range (YYYYMMDD).
+            end_date: The last date of the range (YYYYMMDD).
+
+        Returns:
+            A dictionary containing the version count and timestamps.
+        """
+        return _list_archived_versions(resource_url, start_date, end_date)
+
+    @mcp.tool(
+        description=(
+            "Fetch a specific archived version of a data.gov.hk resource URL using a "
+            "timestamp (YYYYMMDD-HHMM) from list_archived_versions."
+        ),
+    )
+    @tracing.traced
+    def get_archived_file(
+        resource_url: Annotated[
+            str, Field(description="The URL of the data.gov.hk resource.")
+        ],
+        version: Annotated[
+            str,
+            Field(description="The version timestamp (YYYYMMDD-HHMM) to retrieve."),
+        ],
+    ) -> Dict:
+        """Fetch a specific archived version of a resource.
+
+        Args:
+            resource_url: The URL of the data.gov.hk resource.
+            version: The version timestamp (YYYYMMDD-HHMM) to retrieve.
+
+        Returns:
+            A dictionary containing the archived file content.
+        """
+        return _get_archived_file(resource_url, version)
+
+
+def _month_count(start: date, end: date) -> int:
+    """Return the number of calendar months overlapping start..end."""
+    return (end.year - start.year) * 12 + end.month - start.month + 1
+
+
+def _split_into_months(start: date, end: date) -> List[date]:
+    """Return the first day of each calendar month overlapping start..end."""
+    first = start.year * 12 + start.month - 1
+    return [
+        date(index // 12, index % 12 + 1, 1)
+        for index in range(first, first + _month_count(start, end))
+    ]
+
+
+def _fetch_month_versions(resource_url: str, month: date) -> Dict[str, Any]:
+    """
+    Fetch the version timestamps of one calendar month, caching past months.
+
+    Args:
+        resource_url: The URL of the data.gov.hk resource.
+        month: The first day of the month.
+
+    Returns:
+        Dict with the month's timestamps, or an error message.
+    """
+    key = (resource_url, month.strftime("%Y%m"))
+    with _listing_cache_lock:
+        cached = _listing_cache.get(key)
+        if cached is not None:
+            _listing_cache.move_to_end(key)
+            return {"timestamps": cached}
+
+    month_end = month.replace(day=calendar.monthrange(month.year, month.month)[1])
+    params = {
+        "url": resource_url,
+        "start": month.strftime(DATE_FORMAT),
+        "end": month_end.strftime(DATE_FORMAT),
+    }
+    logger.debug("Fetching archived versions with params: %s", params)
+    data = fetch_json_data(LIST_VERSIONS_URL, params=params, timeout=10)
+    if "error" in data:
+        return data
+
+    timestamps = list(data.get("timestamps") or [])
+    if month_end < date.today():
+        with _listing_cache_lock:
+            _listing_cache[key] = timestamps
+            _listing_cache.move_to_end(key)
+            while len(_listing_cache) > MAX_CACHED_LISTINGS:
+                _listing_cache.popitem(last=False)
+    return {"timestamps": timestamps}
+
+
+def _list_archived_versions(
+    resource_url: str, start_date: str, end_date: str
+) -> Dict[str, Any]:
+    """
+    List archived versions of a resource from the data.gov.hk historical archive.
+
+    The date range is split into calendar months that are fetched concurrently, so
+    listings of past months are cached and shared between overlapping ranges. Ranges
+    spanning more than MAX_MONTHS months are rejected.
+
+    Args:
+        resource_url: The URL of the data.gov.hk resource.
+        start_date: The first date of the range in YYYYMMDD format.
+        end_date: The last date of the range in YYYYMMDD format.
+
+    Returns:
+        Dict containing the version count and sorted timestamps, or an error message.
+    """
+    logger.debug(
+        "Listing archived versions of %s from %s to %s",
+        resource_url,
+        start_date,
+        end_date,
+    )
+    invalid = {"error": "Invalid date format. Dates must be in YYYYMMDD format."}
+    if not (_DATE_RE.fullmatch(start_date) and _DATE_RE.fullmatch(end_date)):
+        # strptime also accepts unpadded dates such as "2023111", which would
+        # then be compared with padded timestamps below.
+        return invalid
+    try:
+        start = datetime.strptime(start_date, DATE_FORMAT).date()
+        end = datetime.strptime(end_date, DATE_FORMAT).date()
+    except ValueError:
+        return invalid
+    if start > end:
+        return {"error": "start_date must not be later than end_date."}
+
+    month_count = _month_count(start, end)
+    if month_count > MAX_MONTHS:
+        return {
+            "error": (
+                f"Date range spans {month_count} months; at most {MAX_MONTHS} months "
+                "can be listed per call."
+            )
+        }
+    months = _split_into_months(start, end)
+    workers = min(MAX_WORKERS, len(months))
+    # Each month runs in a copy of this context so its spans join the current trace.
+    contexts = [contextvars.copy_context() for _ in months]
+    with tracing.span("upstream_fetch"):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    lambda context, month: context.run(
+                        _fetch_month_versions, resource_url, month
+                    ),
+                    contexts,
+                    months,
+                )
+            )
+
+    first_day, last_day = start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT)
+    timestamps = set()
+    for result in results:
+        if "error" in result:
+            return result
+        timestamps.update(
+            timestamp
+            for timestamp in result["timestamps"]
+            if first_day <= timestamp[:8] <= last_day
+        )
+    return {
+        "url": resource_url,
+        "version-count": len(timestamps),
+        "timestamps": sorted(timestamps),
+    }
+
+
+def _decode_content(content: bytes, content_type: str) -> str:
+    """
+    Decode a response body using the charset in its Content-Type, or UTF-8.
+
+    requests assumes ISO-8859-1 for text/* responses without a charset, which
+    garbles the UTF-8 CSV and text files served by data.gov.hk, so that default is
+    not used.
+    """
+    match = _CHARSET_RE.search(content_type)
+    encoding = match.group(1) if match else "utf-8"
+    try:
+        text = content.decode(encoding, errors="replace")
+    except LookupError:
+        logger.error("Unknown charset %s. Decoding as UTF-8.", encoding)
+        text = content.decode("utf-8", errors="replace")
+    return text.lstrip("\ufeff")
+
+
+def _get_archived_file(resource_url: str, version: str) -> Dict[str, Any]:
+    """
+    Fetch a specific archived version of a resource.
+
+    Args:
+        resource_url: The URL of the data.gov.hk resource.
+        version: The version timestamp in YYYYMMDD-HHMM format.
+
+    Returns:
+        Dict containing the parsed JSON data or the raw text content, or an error
+        message.
+    """
+    logger.debug("Fetching archived version %s of %s", version, resource_url)
+    params = {"url": resource_url, "time": version}
+    try:
+        with tracing.span("upstream_fetch"):
+            response = fetch(GET_FILE_URL, params=params, timeout=30)
+            response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        return {"error": f"Failed to fetch archived file: {e}"}
+
+    content_type = response.headers.get("Content-Type", "")
+    with tracing.span("text_decode"):
+        text = _decode_content(response.content, content_type)
+    result: Dict[str, Any] = {
+        "url": resource_url,
+        "version": version,
+        "content_type": content_type,
+    }
+    try:
+        with tracing.span("json_decode"):
+            result["data"] = json.loads(text)
+    except ValueError:
+        result["content"] = text
+    return result
@@ -6,9 +6,12 @@ This module retrieves category data from data.gov.hk in various languages.
 
 import logging
 from typing import Dict, Any
-from hkopenai_common.json_utils import fetch_json_data
 from pydantic import Field
 from typing_extensions import Annotated
+from .. import tracing
+from ..cursors import CursorStore, collection_path
+from ..response_cache import ResponseCache
+from ..upstream import fetch_json_data
 
 # Configure logging
 logging.basicConfig(format="%(asctime)s - %(levelname)s - %(message)s")
@@ -17,10 +20,13 @@ logger = logging.getLogger(__name__)
 
 def register(mcp):
     """Registers the datagovhk_categories tool with the FastMCP server."""
+    cache = ResponseCache()
+    cursors = CursorStore()
 
     @mcp.tool(
         description="Fetch categories from data.gov.hk based on language (en, tc, sc).",
     )
+    @tracing.traced
     def get_categories(
         language: Annotated[
             str,
@@ -28,16 +34,43 @@ def register(mcp):
                 description="The language code (en, tc, sc) for the data (default is 'en')."
             ),
         ] = "en",
+        page_size: Annotated[
+            int,
+            Field(
+                description=(
+                    "Return results in pages of this many items with a cursor for the "
+                    "next page (default is 0, which returns everything)."
+                )
+            ),
+        ] = 0,
+        cursor: Annotated[
+            str,
+            Field(
+                description=(
+                    "The next_cursor from a previous page to read the next page "
+                    "without refetching."
+                )
+            ),
+        ] = "",
     ) -> Dict:
         """Fetch dataset categories from data.gov.hk in the specified language.
 
         Args:
             language: The language code (en, tc, sc) for the data (default is 'en').
+            page_size: Number of categories per page; 0 returns everything (default).
+            cursor: The next_cursor from a previous page, to read the next page.
 
         Returns:
             A dictionary containing the list of categories.
         """
-        return _get_categories(language)
+        key = ("get_categories", language)
+        if cursor:
+            return cursors.read(cursor, key)
+        result = cache.get_or_fetch(key, lambda: _get_categories(language))
+        if page_size > 0:
+            path = collection_path(result, "categories")
+            return cursors.open(result, path, page_size, key)
+        return result
 
 
 def _get_categories(language: str = "en") -> Dict[str, Any]:
@@ -48,7 +81,7 @@ def _get_categories(language: str = "en") -> Dict[str, Any]:
         language: The language code for the categories list (en, tc, sc). Defaults to 'en'.
 
     Returns:
-        Dict containing the categories data.
+        Dict containing the categories data; a bare list is wrapped under "categories".
     """
     logger.debug("Fetching categories for language: %s", language)
     url_map = {
@@ -58,4 +91,9 @@ def _get_categories(language: str = "en") -> Dict[str, Any]:
     }
     url = url_map.get(language, url_map["en"])
     logger.debug("Using URL: %s", url)
-    return fetch_json_data(url)
+    with tracing.span("upstream_fetch"):
+        data = fetch_json_data(url)
+    # Wrap a bare list so it is cached and paged like the dictionary responses.
+    if isinstance(data, list):
+        return {"categories": data}
+    return data
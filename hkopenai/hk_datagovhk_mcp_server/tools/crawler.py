@@ -6,9 +6,10 @@ This module retrieves dataset info from data.gov.hk by category and page.
 
 import logging
 from typing import Dict, Any
-from hkopenai_common.json_utils import fetch_json_data
 from pydantic import Field
 from typing_extensions import Annotated
+from .. import tracing
+from ..upstream import fetch_json_data
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -20,6 +21,7 @@ def register(mcp):
     @mcp.tool(
         description="Crawl datasets from data.gov.hk based on category and page.",
     )
+    @tracing.traced
     def crawl_datasets(
         category: Annotated[str, Field(description="The category to filter datasets.")],
         page: Annotated[
@@ -75,7 +77,8 @@ def _crawl_datasets(category: str, page: int = 1) -> Dict[str, Any]:
         "sec-ch-ua-mobile": "?0",
         "sec-ch-ua-platform": r"\"Windows\"",
     }
-    data = fetch_json_data(base_url, params=params, headers=headers, timeout=10)
+    with tracing.span("upstream_fetch"):
+        data = fetch_json_data(base_url, params=params, headers=headers, timeout=10)
     logger.debug("Received JSON response with %s datasets", len(data.get("data", [])))
 
     return data
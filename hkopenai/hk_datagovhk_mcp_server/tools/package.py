@@ -6,9 +6,12 @@ This module retrieves detailed package info from data.gov.hk using package IDs.
 
 import logging
 from typing import Dict, Any
-from hkopenai_common.json_utils import fetch_json_data
 from pydantic import Field
 from typing_extensions import Annotated
+from .. import tracing
+from ..cursors import CursorStore
+from ..response_cache import ResponseCache
+from ..upstream import fetch_json_data
 
 # Configure logging
 logging.basicConfig(format="%(asctime)s - %(levelname)s - %(message)s")
@@ -17,6 +20,8 @@ logger = logging.getLogger(__name__)
 
 def register(mcp):
     """Registers the datagovhk_package tool with the FastMCP server."""
+    cache = ResponseCache()
+    cursors = CursorStore()
 
     @mcp.tool(
         description=(
@@ -24,6 +29,7 @@ def register(mcp):
             "typically obtained from the crawler tool."
         ),
     )
+    @tracing.traced
     def get_package_data(
         package_id: Annotated[
             str, Field(description="The unique identifier of the package to retrieve.")
@@ -34,17 +40,45 @@ def register(mcp):
                 description="The language code (en, tc, sc) for the data (default is 'en')."
             ),
         ] = "en",
+        page_size: Annotated[
+            int,
+            Field(
+                description=(
+                    "Return results in pages of this many items with a cursor for the "
+                    "next page (default is 0, which returns everything)."
+                )
+            ),
+        ] = 0,
+        cursor: Annotated[
+            str,
+            Field(
+                description=(
+                    "The next_cursor from a previous page to read the next page "
+                    "without refetching."
+                )
+            ),
+        ] = "",
     ) -> Dict:
         """Fetch detailed package data from data.gov.hk using the package ID.
 
         Args:
             package_id: The unique identifier of the package to retrieve.
             language: The language code (en, tc, sc) for the data (default is 'en').
+            page_size: Number of resources per page; 0 returns everything (default).
+            cursor: The next_cursor from a previous page, to read the next page.
 
         Returns:
             A dictionary containing the detailed package information.
         """
-        return _get_package_data(package_id, language)
+        key = ("get_package_data", package_id, language)
+        if cursor:
+            return cursors.read(cursor, key)
+        result = cache.get_or_fetch(
+            key, lambda: _get_package_data(package_id, language)
+        )
+        if page_size > 0:
+            return cursors.open(result, ("result", "resources"), page_size, key)
+        return result
 
 
 def _get_package_data(package_id: str, language: str = "en") -> Dict[str, Any]:
@@ -75,4 +109,30 @@ def _get_package_data(package_id: str, language: str = "en") -> Dict[str, Any]:
             "(KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36 Edg/138.0.0.0"
         ),
     }
-    return fetch_json_data(url, headers=headers, timeout=10)
+    with tracing.span("upstream_fetch"):
+        return fetch_json_data(url, headers=headers, timeout=10)
+
+
+def _list_package_ids(language: str = "en") -> Dict[str, Any]:
+    """
+    List the IDs of every package in the data.gov.hk catalogue.
+
+    Args:
+        language: The language code (en, tc, sc) of the catalogue. Defaults to "en".
+
+    Returns:
+        Dict containing the package IDs under "result", or an error message.
+    """
+    if language not in ["en", "tc", "sc"]:
+        logger.error("Invalid language code: %s. Defaulting to 'en'.", language)
+        language = "en"
+    url = f"https://data.gov.hk/{language}-data/api/3/action/package_list"
+    logger.debug("Listing packages from URL: %s", url)
+    headers = {
+        "Accept": "application/json",
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36 Edg/138.0.0.0"
+        ),
+    }
+    return fetch_json_data(url, headers=headers, timeout=30)
@@ -0,0 +1,301 @@
+"""
+Recommend related datasets from a precomputed TF-IDF index.
+
+This module builds TF-IDF vectors from the titles, notes and tags of data.gov.hk
+packages, persists them as a dense NumPy matrix, and answers top-k cosine similarity
+queries against the memory-mapped matrix without calling the upstream API.
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import re
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from pydantic import Field
+from typing_extensions import Annotated
+from .. import tracing
+from .package import _get_package_data, _list_package_ids
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+RELATED_INDEX_ENV = "HKDATAGOVHK_RELATED_INDEX"
+VECTORS_FILE = "vectors.npy"
+PACKAGES_FILE = "packages.json"
+DEFAULT_MAX_FEATURES = 4096
+
+# CJK text has no spaces between words, so runs of CJK ideographs are split into
+# overlapping character bigrams while other scripts are split into words.
+_CJK = "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+_TOKEN_RE = re.compile(f"[{_CJK}]+|(?:(?![{_CJK}])\\w){{2,}}")
+_CJK_RE = re.compile(f"[{_CJK}]")
+
+
+class RelatedIndex:
+    """A memory-mapped TF-IDF matrix with one L2-normalized row per package."""
+
+    def __init__(self, vectors: Any, package_ids: List[str], titles: List[str]):
+        self.vectors = vectors
+        self.package_ids = package_ids
+        self.titles = titles
+        self._rows = {package_id: row for row, package_id in enumerate(package_ids)}
+
+    def query(self, package_id: str, k: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the k packages most similar to package_id.
+
+        Args:
+            package_id: The ID of an indexed package.
+            k: Number of related packages to return.
+
+        Returns:
+            List of related packages with their cosine similarity, most similar first,
+            or None if the package is not in the index.
+        """
+        row = self._rows.get(package_id)
+        if row is None:
+            return None
+        scores = self.vectors @ self.vectors[row]
+        scores[row] = -np.inf
+        k = max(0, min(k, len(self.package_ids) - 1))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            {
+                "package_id": self.package_ids[i],
+                "title": self.titles[i],
+                "score": round(float(scores[i]), 6),
+            }
+            for i in top
+        ]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "numpy is required for related dataset search. "
+            "Install it with: pip install hkopenai.hk_datagovhk_mcp_server[related]"
+        )
+
+
+def _package_text(package: Dict[str, Any]) -> str:
+    """Extract the title, notes and tag names of a package_show result."""
+    result = package.get("result") or {}
+    tags = [tag.get("name", "") for tag in result.get("tags") or []]
+    return " ".join([result.get("title") or "", result.get("notes") or ""] + tags)
+
+
+def _tokenize(text: str) -> List[str]:
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if _CJK_RE.match(token) and len(token) > 1:
+            tokens.extend(token[i : i + 2] for i in range(len(token) - 1))
+        else:
+            tokens.append(token)
+    return tokens
+
+
+def build_index(
+    package_ids: Iterable[str],
+    index_dir: str,
+    language: str = "en",
+    max_features: int = DEFAULT_MAX_FEATURES,
+    fetch: Callable[[str, str], Dict[str, Any]] = _get_package_data,
+) -> int:
+    """
+    Build and persist a TF-IDF index for the given packages.
+
+    Args:
+        package_ids: IDs of the packages to index.
+        index_dir: Directory to write vectors.npy and packages.json to.
+        language: The language code (en, tc, sc) of the package data. Defaults to "en".
+        max_features: Maximum vocabulary size, keeping the most common terms.
+        fetch: Function used to fetch package data. Defaults to _get_package_data.
+
+    Returns:
+        The number of packages indexed.
+    """
+    _require_numpy()
+    ids: List[str] = []
+    titles: List[str] = []
+    documents: List[Counter] = []
+    for package_id in package_ids:
+        package = fetch(package_id, language)
+        if "error" in package:
+            logger.error("Skipping package %s: %s", package_id, package["error"])
+            continue
+        ids.append(package_id)
+        titles.append((package.get("result") or {}).get("title") or "")
+        documents.append(Counter(_tokenize(_package_text(package))))
+
+    document_frequency: Counter = Counter()
+    for terms in documents:
+        document_frequency.update(terms.keys())
+    most_common = document_frequency.most_common(max_features)
+    vocabulary = {term: column for column, (term, _) in enumerate(most_common)}
+
+    count = len(documents)
+    idf = np.ones(len(vocabulary), dtype=np.float32)
+    for term, column in vocabulary.items():
+        idf[column] += math.log((1 + count) / (1 + document_frequency[term]))
+    vectors = np.zeros((count, len(vocabulary)), dtype=np.float32)
+    for row, terms in enumerate(documents):
+        for term, frequency in terms.items():
+            column = vocabulary.get(term)
+            if column is not None:
+                vectors[row, column] = 1 + math.log(frequency)
+    vectors *= idf
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors /= np.where(norms == 0, 1, norms)
+
+    os.makedirs(index_dir, exist_ok=True)
+    np.save(os.path.join(index_dir, VECTORS_FILE), vectors)
+    with open(os.path.join(index_dir, PACKAGES_FILE), "w", encoding="utf-8") as f:
+        json.dump({"package_ids": ids, "titles": titles}, f, ensure_ascii=False)
+    logger.debug("Indexed %d packages with %d terms", count, len(vocabulary))
+    return count
+
+
+def load_index(index_dir: str) -> RelatedIndex:
+    """
+    Load a persisted index, memory-mapping the vector matrix.
+
+    Args:
+        index_dir: Directory containing vectors.npy and packages.json.
+
+    Returns:
+        The loaded RelatedIndex.
+    """
+    _require_numpy()
+    vectors = np.load(os.path.join(index_dir, VECTORS_FILE), mmap_mode="r")
+    with open(os.path.join(index_dir, PACKAGES_FILE), encoding="utf-8") as f:
+        packages = json.load(f)
+    return RelatedIndex(vectors, packages["package_ids"], packages["titles"])
+
+
+def register(mcp):
+    """Registers the datagovhk_related tool with the FastMCP server."""
+    index_dir = os.environ.get(RELATED_INDEX_ENV)
+    index = None
+    if index_dir:
+        try:
+            index = load_index(index_dir)
+        except (ImportError, OSError, ValueError, KeyError) as e:
+            logger.error("Failed to load related dataset index %s: %s", index_dir, e)
+
+    @mcp.tool(
+        description=(
+            "Find datasets related to a data.gov.hk package by similarity of their "
+            "titles, descriptions and tags."
+        ),
+    )
+    @tracing.traced
+    def find_related_datasets(
+        package_id: Annotated[
+            str, Field(description="The unique identifier of the package to compare.")
+        ],
+        k: Annotated[
+            int, Field(description="The number of related datasets to return.")
+        ] = 10,
+    ) -> Dict:
+        """Find the packages most similar to the given package.
+
+        Args:
+            package_id: The unique identifier of the package to compare.
+            k: The number of related datasets to return (default is 10).
+
+        Returns:
+            A dictionary containing the list of related datasets.
+        """
+        return _find_related_datasets(index, package_id, k)
+
+
+def _find_related_datasets(
+    index: Optional[RelatedIndex], package_id: str, k: int = 10
+) -> Dict[str, Any]:
+    """
+    Find the k packages most similar to package_id in the precomputed index.
+
+    Args:
+        index: The loaded index, or None if no index is configured.
+        package_id: The ID of the package to find related datasets for.
+        k: The number of related datasets to return. Defaults to 10.
+
+    Returns:
+        Dict containing the related datasets, or an error message.
+    """
+    logger.debug("Finding %d datasets related to %s", k, package_id)
+    if index is None:
+        return {
+            "error": (
+                "Related dataset index is not available. Build one with "
+                "'python -m hkopenai.hk_datagovhk_mcp_server.tools.related' and set "
+                f"{RELATED_INDEX_ENV} to its directory."
+            )
+        }
+    with tracing.span("similarity_query"):
+        related = index.query(package_id, k)
+    if related is None:
+        return {"error": f"Package {package_id} is not in the related dataset index."}
+    return {"package_id": package_id, "related": related}
+
+
+def main(args_list=None):
+    """Build a related dataset index from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Build the related dataset index for the HK Datagovhk MCP Server"
+    )
+    parser.add_argument("package_ids", nargs="*", help="Package IDs to index")
+    parser.add_argument(
+        "-a",
+        "--all",
+        action="store_true",
+        help="Index every package listed by the data.gov.hk package_list API",
+    )
+    parser.add_argument(
+        "-o", "--output", required=True, help="Directory to write the index to"
+    )
+    parser.add_argument(
+        "-f", "--ids-file", help="File containing one package ID per line"
+    )
+    parser.add_argument(
+        "-l", "--language", default="en", help="Language code (en, tc, sc)"
+    )
+    parser.add_argument(
+        "--max-features",
+        type=int,
+        default=DEFAULT_MAX_FEATURES,
+        help=f"Maximum vocabulary size (default: {DEFAULT_MAX_FEATURES})",
+    )
+    args = parser.parse_args(args_list)
+
+    package_ids = list(args.package_ids)
+    if args.ids_file:
+        with open(args.ids_file, encoding="utf-8") as f:
+            package_ids.extend(line.strip() for line in f if line.strip())
+    if args.all:
+        listing = _list_package_ids(args.language)
+        if not isinstance(listing.get("result"), list):
+            parser.exit(
+                1, f"Failed to list packages: {listing.get('error', listing)}\n"
+            )
+        package_ids.extend(listing["result"])
+    if not package_ids:
+        parser.error("no package IDs given; pass IDs, --ids-file or --all")
+    package_ids = list(dict.fromkeys(package_ids))
+    count = build_index(package_ids, args.output, args.language, args.max_features)
+    print(f"Indexed {count} packages into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+"""
+Opt-in per-request tracing for the HK Data.gov.hk MCP Server.
+
+This module records timed spans for sampled tool calls, optionally profiles them with
+a stack sampler that only looks at the thread running the tool, and keeps the
+resulting traces in an in-memory ring buffer that can be inspected through the
+debug_recent_traces tool.
+"""
+
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from fastmcp.server.middleware import Middleware
+from pydantic import Field
+from typing_extensions import Annotated
+
+from .env import env_float, env_int
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+TRACE_ENV = "HKDATAGOVHK_TRACE"
+TRACE_SAMPLE_RATE_ENV = "HKDATAGOVHK_TRACE_SAMPLE_RATE"
+TRACE_PROFILE_RATE_ENV = "HKDATAGOVHK_TRACE_PROFILE_RATE"
+TRACE_BUFFER_SIZE_ENV = "HKDATAGOVHK_TRACE_BUFFER_SIZE"
+
+DEFAULT_SAMPLE_RATE = 1.0
+DEFAULT_PROFILE_RATE = 0.01
+DEFAULT_BUFFER_SIZE = 200
+PROFILE_TOP_FUNCTIONS = 15
+PROFILE_INTERVAL = 0.005
+
+_config: Dict[str, Any] = {
+    "enabled": False,
+    "sample_rate": DEFAULT_SAMPLE_RATE,
+    "profile_rate": DEFAULT_PROFILE_RATE,
+    "buffer_size": DEFAULT_BUFFER_SIZE,
+}
+_buffer: Deque["Trace"] = deque(maxlen=DEFAULT_BUFFER_SIZE)
+_buffer_lock = threading.Lock()
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar(
+    "hkdatagovhk_current_trace", default=None
+)
+
+
+class Trace:
+    """Timed spans and optional profile output collected for a single tool call."""
+
+    def __init__(self, tool: str, arguments: Optional[Dict[str, Any]] = None):
+        self.tool = tool
+        self.arguments = dict(arguments or {})
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.duration_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self.spans: List[Dict[str, Any]] = []
+        self.profile: Optional[Dict[str, Any]] = None
+        # perf_counter times of the traced tool body: (ready, start, end), where
+        # ready is when the spans recorded before the body, such as admission, ended.
+        self.body: Optional[Tuple[float, float, float]] = None
+        self.last_span_end = self._start
+
+    def add_span(self, name: str, start: float, end: float) -> None:
+        """Record a span given its perf_counter start and end times."""
+        self.last_span_end = max(self.last_span_end, end)
+        self.spans.append(
+            {
+                "name": name,
+                "offset_ms": round((start - self._start) * 1000, 3),
+                "duration_ms": round((end - start) * 1000, 3),
+            }
+        )
+
+    def finish(self, error: Optional[str] = None) -> None:
+        """Mark the trace as complete."""
+        self.duration_ms = round((time.perf_counter() - self._start) * 1000, 3)
+        self.error = error
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable view of the trace."""
+        return {
+            "tool": self.tool,
+            "arguments": self.arguments,
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+            "spans": list(self.spans),
+            "profile": self.profile,
+        }
+
+
+def configure(
+    enabled: Optional[bool] = None,
+    sample_rate: Optional[float] = None,
+    buffer_size: Optional[int] = None,
+    profile_rate: Optional[float] = None,
+) -> None:
+    """
+    Configure tracing, falling back to environment variables for unset options.
+
+    Args:
+        enabled: Whether tracing is enabled. Defaults to the HKDATAGOVHK_TRACE env var.
+        sample_rate: Fraction of tool calls to trace, between 0 and 1.
+            Defaults to HKDATAGOVHK_TRACE_SAMPLE_RATE or 1.0.
+        buffer_size: Number of traces kept in the ring buffer.
+            Defaults to HKDATAGOVHK_TRACE_BUFFER_SIZE or 200.
+        profile_rate: Fraction of traced tool calls to also profile, between 0 and 1.
+            Defaults to HKDATAGOVHK_TRACE_PROFILE_RATE or 0.01.
+    """
+    global _buffer  # pylint: disable=global-statement
+    if enabled is None:
+        enabled = os.environ.get(TRACE_ENV, "").lower() in ("1", "true", "yes", "on")
+    if sample_rate is None:
+        sample_rate = env_float(TRACE_SAMPLE_RATE_ENV, DEFAULT_SAMPLE_RATE)
+    if buffer_size is None:
+        buffer_size = env_int(TRACE_BUFFER_SIZE_ENV, DEFAULT_BUFFER_SIZE)
+    if profile_rate is None:
+        profile_rate = env_float(TRACE_PROFILE_RATE_ENV, DEFAULT_PROFILE_RATE)
+
+    _config["enabled"] = enabled
+    _config["sample_rate"] = min(max(sample_rate, 0.0), 1.0)
+    _config["buffer_size"] = max(buffer_size, 1)
+    _config["profile_rate"] = min(max(profile_rate, 0.0), 1.0)
+    with _buffer_lock:
+        _buffer = deque(_buffer, maxlen=_config["buffer_size"])
+    logger.debug("Tracing configuration: %s", _config)
+
+
+def is_enabled() -> bool:
+    """Return True if tracing is enabled."""
+    return _config["enabled"]
+
+
+def _sampled(option: str) -> bool:
+    """Return True for the configured fraction of calls, e.g. "sample_rate"."""
+    rate = _config[option]
+    return rate >= 1.0 or random.random() < rate  # nosec B311
+
+
+def active() -> bool:
+    """Return True if the current call is part of a sampled trace."""
+    return _current_trace.get() is not None
+
+
+def add_span(name: str, start: float, end: float) -> None:
+    """Record a span with perf_counter start and end times on the current trace."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add_span(name, start, end)
+
+
+def record(trace: Trace) -> None:
+    """Append a finished trace to the ring buffer."""
+    with _buffer_lock:
+        _buffer.append(trace)
+
+
+def clear() -> None:
+    """Drop all buffered traces."""
+    with _buffer_lock:
+        _buffer.clear()
+
+
+def recent_traces(limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Return the slowest buffered traces, slowest first.
+
+    Args:
+        limit: Maximum number of traces to return.
+
+    Returns:
+        List of trace dictionaries.
+    """
+    with _buffer_lock:
+        traces = list(_buffer)
+    traces.sort(key=lambda t: t.duration_ms or 0.0, reverse=True)
+    return [trace.to_dict() for trace in traces[: max(limit, 0)]]
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time a block of code as a named span of the current trace, if any."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_span(name, start, time.perf_counter())
+
+
+class _StackSampler(threading.Thread):
+    """
+    Sample the stack of one thread on a timer, counting frames below a root frame.
+
+    Only the profiled thread's frame is read from sys._current_frames(), so work
+    done by concurrent tool calls or the event loop is never attributed to it.
+    """
+
+    def __init__(self, thread_id: int, root: Any, interval: float = PROFILE_INTERVAL):
+        super().__init__(name="hkdatagovhk-trace-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.root = root
+        self.interval = interval
+        self.samples = 0
+        self.cumulative: Counter = Counter()
+        self.own: Counter = Counter()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(  # pylint: disable=protected-access
+                self.thread_id
+            )
+            labels = []
+            while frame is not None and frame is not self.root:
+                code = frame.f_code
+                labels.append(
+                    f"{code.co_name} "
+                    f"({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            if frame is None or not labels:
+                # The thread is not inside the profiled call right now.
+                continue
+            self.samples += 1
+            self.own[labels[0]] += 1
+            self.cumulative.update(set(labels))
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop sampling and return the most frequently sampled functions."""
+        self._stopped.set()
+        self.join()
+        return {
+            "interval_ms": self.interval * 1000,
+            "samples": self.samples,
+            "functions": [
+                {"function": label, "cumulative": count, "self": self.own[label]}
+                for label, count in self.cumulative.most_common(PROFILE_TOP_FUNCTIONS)
+            ],
+        }
+
+
+def _start_sampler(root: Any) -> Optional[_StackSampler]:
+    """Start sampling the current thread below root, returning None on failure."""
+    sampler = _StackSampler(threading.get_ident(), root)
+    try:
+        sampler.start()
+    except RuntimeError as e:
+        logger.debug("Skipping profile: %s", e)
+        return None
+    return sampler
+
+
+def traced(func: Callable) -> Callable:
+    """
+    Decorate a tool function so that its execution is recorded as a "tool" span.
+
+    A profile_rate fraction of traced calls is also profiled by sampling the
+    thread's stack every PROFILE_INTERVAL seconds while it runs, so overlapping
+    calls each get a profile of their own work. Calls shorter than the interval
+    may have no samples. It is a no-op when the call is not part of a sampled
+    trace.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        trace = _current_trace.get()
+        if trace is None:
+            return func(*args, **kwargs)
+        root = sys._getframe()  # pylint: disable=protected-access
+        sampler = _start_sampler(root) if _sampled("profile_rate") else None
+        ready = trace.last_span_end
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            if sampler is not None:
+                trace.profile = sampler.stop()
+            trace.body = (ready, start, end)
+            trace.add_span("tool", start, end)
+
+    return wrapper
+
+
+class TracingMiddleware(Middleware):
+    """Middleware that starts a trace for a sampled fraction of tool calls.
+
+    The "call_tool" span covers the whole call. For tools decorated with traced,
+    the time FastMCP spends before the body, mostly pydantic argument validation,
+    is recorded as a "validation" span, and the time after it, mostly converting
+    the result to a serialized ToolResult, as a "serialization" span.
+    """
+
+    async def on_call_tool(self, context, call_next):
+        """Trace the tool call if it is sampled."""
+        if not is_enabled() or not _sampled("sample_rate"):
+            return await call_next(context)
+        params = context.message
+        trace = Trace(
+            getattr(params, "name", "unknown"), getattr(params, "arguments", None)
+        )
+        token = _current_trace.set(trace)
+        start = time.perf_counter()
+        error = None
+        try:
+            return await call_next(context)
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            end = time.perf_counter()
+            if trace.body is not None:
+                ready, body_start, body_end = trace.body
+                trace.add_span("validation", max(start, ready), body_start)
+                trace.add_span("serialization", body_end, end)
+            trace.add_span("call_tool", start, end)
+            trace.finish(error)
+            _current_trace.reset(token)
+            record(trace)
+
+
+def register(mcp):
+    """Registers the tracing middleware and the debug_recent_traces tool."""
+    mcp.add_middleware(TracingMiddleware())
+
+    @mcp.tool(
+        description="Return the slowest recently traced tool calls with timed spans.",
+    )
+    def debug_recent_traces(
+        limit: Annotated[
+            int,
+            Field(
+                description="The maximum number of traces to return (default is 10)."
+            ),
+        ] = 10,
+    ) -> Dict:
+        """Return the slowest traces from the in-memory ring buffer.
+
+        Args:
+            limit: The maximum number of traces to return (default is 10).
+
+        Returns:
+            A dictionary containing the list of traces, slowest first.
+        """
+        return {"traces": recent_traces(limit)}
+
+
+configure()
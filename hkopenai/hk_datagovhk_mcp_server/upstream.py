@@ -0,0 +1,214 @@
+"""
+Upstream HTTP requests for the HK Data.gov.hk MCP Server.
+
+This module sends requests to data.gov.hk with requests.get. During a traced call it
+uses a one-off session whose connections time each phase of the request instead, so
+DNS lookup, TCP connect, TLS handshake, upstream wait, download and JSON decode are
+recorded as separate spans.
+"""
+
+import json
+import logging
+import socket
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+from . import tracing
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+class _TracedConnectionMixin:
+    """Record DNS, TCP connect and upstream wait spans for a urllib3 connection."""
+
+    _dns_host: str
+    port: int
+    connected_at: Optional[float] = None
+
+    def _new_conn(self):
+        self.connected_at = None
+        if not tracing.active():
+            return super()._new_conn()
+        try:
+            with tracing.span("dns"):
+                addresses = socket.getaddrinfo(
+                    self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM
+                )
+        except socket.gaierror:
+            # Let urllib3 resolve again and raise its own error for this version.
+            return super()._new_conn()
+
+        host = self._dns_host
+        error: Optional[Exception] = None
+        try:
+            with tracing.span("tcp_connect"):
+                for address in dict.fromkeys(info[4][0] for info in addresses):
+                    self._dns_host = address
+                    try:
+                        sock = super()._new_conn()
+                    except (ConnectTimeoutError, NewConnectionError) as e:
+                        error = e
+                        continue
+                    self.connected_at = time.perf_counter()
+                    return sock
+        finally:
+            self._dns_host = host
+        raise error or NewConnectionError(self, f"No addresses found for {host}")
+
+    def getresponse(self, *args, **kwargs):
+        """Wait for the response headers, recorded as the upstream_wait span."""
+        with tracing.span("upstream_wait"):
+            return super().getresponse(*args, **kwargs)
+
+
+class _TracedHTTPConnection(_TracedConnectionMixin, HTTPConnection):
+    """An HTTP connection that records its phases as spans."""
+
+
+class _TracedHTTPSConnection(_TracedConnectionMixin, HTTPSConnection):
+    """An HTTPS connection that also records the TLS handshake as a span."""
+
+    def connect(self):
+        super().connect()  # pylint: disable=no-member
+        if self.connected_at is not None:
+            tracing.add_span("tls_handshake", self.connected_at, time.perf_counter())
+
+
+class _TracedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TracedHTTPConnection
+
+
+class _TracedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TracedHTTPSConnection
+
+
+class _TracedAdapter(HTTPAdapter):
+    """A transport adapter whose connection pools use the traced connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TracedHTTPConnectionPool,
+            "https": _TracedHTTPSConnectionPool,
+        }
+
+
+def _traced_session() -> requests.Session:
+    """Return a new session whose connections record their phases as spans."""
+    session = requests.Session()
+    adapter = _TracedAdapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+) -> requests.Response:
+    """
+    Send a GET request and read the response body.
+
+    Args:
+        url: The URL to fetch.
+        params: Optional dictionary of query parameters.
+        headers: Optional dictionary of request headers.
+        timeout: Optional timeout in seconds.
+
+    Returns:
+        The response with its body already downloaded.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+    """
+    logger.debug("Fetching %s with params: %s", url, params)
+    if not tracing.active():
+        return requests.get(url, params=params, headers=headers, timeout=timeout)
+    # Like requests.get, use a new session so traced calls open fresh connections.
+    with _traced_session() as session:
+        response = session.get(
+            url, params=params, headers=headers, timeout=timeout, stream=True
+        )
+        with tracing.span("download"):
+            _ = response.content
+    return response
+
+
+def fetch_json_data(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    encoding: str = "utf-8",
+) -> Dict[str, Any]:
+    """
+    Fetch JSON data from a URL, returning errors as an error message.
+
+    This matches hkopenai_common.json_utils.fetch_json_data, with the request phases
+    and JSON decoding recorded as spans of the current trace.
+
+    Args:
+        url: The URL to fetch data from.
+        params: Optional dictionary of query parameters.
+        headers: Optional dictionary of request headers.
+        timeout: Optional timeout in seconds.
+        encoding: Encoding used when the response is not valid JSON as served.
+
+    Returns:
+        A dictionary containing the JSON response, or an error message.
+    """
+    try:
+        response = fetch(url, params=params, headers=headers, timeout=timeout)
+        response.raise_for_status()
+    except requests.exceptions.HTTPError as http_err:
+        return {
+            "error": (
+                f"HTTP error occurred: {http_err}. "
+                f"Status code: {http_err.response.status_code}. "
+                f"Response: {http_err.response.text}"
+            )
+        }
+    except requests.exceptions.ConnectionError as conn_err:
+        return {
+            "error": (
+                f"Connection error occurred: {conn_err}. "
+                "Please check your network connection."
+            )
+        }
+    except requests.exceptions.Timeout as timeout_err:
+        return {
+            "error": f"The request timed out: {timeout_err}. Please try again later."
+        }
+    except requests.exceptions.RequestException as req_err:
+        return {"error": f"An unexpected error occurred during the request: {req_err}."}
+
+    with tracing.span("json_decode"):
+        try:
+            return response.json()
+        except ValueError:
+            pass
+        try:
+            return json.loads(response.content.decode(encoding).lstrip("\ufeff"))
+        except UnicodeDecodeError as decode_err:
+            return {
+                "error": (
+                    "UnicodeDecodeError: Failed to decode content with encoding "
+                    f"{encoding}: {decode_err}. Try a different encoding."
+                )
+            }
+        except ValueError:
+            return {
+                "error": (
+                    "Failed to parse JSON response from API. The API might have "
+                    "returned non-JSON data or an empty response."
+                )
+            }
@@ -0,0 +1,155 @@
+"""
+Module for testing admission control.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+
+from hkopenai.hk_datagovhk_mcp_server import admission
+from hkopenai.hk_datagovhk_mcp_server.tools import archive
+from hkopenai.hk_datagovhk_mcp_server.admission import (
+    AdmissionController,
+    AdmissionRejected,
+)
+
+
+class TestAdmissionController(unittest.TestCase):
+    """
+    Test class for verifying AdmissionController functionality.
+
+    This class contains test cases to ensure budgets, priorities, rejection and
+    statistics work as expected.
+    """
+
+    def test_priority_order(self):
+        """
+        Test that interactive calls are admitted before queued bulk calls.
+        """
+
+        async def run():
+            controller = AdmissionController(max_concurrency=1, max_queue_depth=10)
+            order = []
+            await controller.acquire("get_categories")
+
+            async def call(tool):
+                await controller.acquire(tool)
+                order.append(tool)
+                controller.release(tool, 0.01)
+
+            tasks = [
+                asyncio.ensure_future(call("crawl_datasets")),
+                asyncio.ensure_future(call("crawl_datasets")),
+                asyncio.ensure_future(call("get_package_data")),
+            ]
+            await asyncio.sleep(0)
+            self.assertEqual(controller.queue_depth(), 3)
+            controller.release("get_categories", 0.01)
+            await asyncio.gather(*tasks)
+            return order
+
+        order = asyncio.run(run())
+        self.assertEqual(
+            order, ["get_package_data", "crawl_datasets", "crawl_datasets"]
+        )
+
+    def test_per_tool_budget(self):
+        """
+        Test that a tool at its budget does not block other tools.
+        """
+
+        async def run():
+            controller = AdmissionController(
+                max_concurrency=4, tool_limits={"crawl_datasets": 1}
+            )
+            await controller.acquire("crawl_datasets")
+            blocked = asyncio.ensure_future(controller.acquire("crawl_datasets"))
+            await asyncio.sleep(0)
+            await asyncio.wait_for(controller.acquire("get_categories"), timeout=1)
+            self.assertFalse(blocked.done())
+            self.assertEqual(controller.stats()["in_flight"], 2)
+            controller.release("crawl_datasets", 0.01)
+            await asyncio.wait_for(blocked, timeout=1)
+
+        asyncio.run(run())
+
+    def test_archive_listing_budget_covers_fan_out(self):
+        """
+        Test that the list_archived_versions budget accounts for its thread fan-out.
+        """
+        upstream = admission.TOOL_LIMITS["list_archived_versions"] * archive.MAX_WORKERS
+        self.assertLessEqual(upstream, admission.DEFAULT_TOOL_LIMIT)
+
+    def test_rejects_when_queue_full(self):
+        """
+        Test that calls are rejected with a retry-after hint once the queue is full.
+        """
+
+        async def run():
+            controller = AdmissionController(max_concurrency=1, max_queue_depth=1)
+            await controller.acquire("get_categories")
+            waiting = asyncio.ensure_future(controller.acquire("get_categories"))
+            await asyncio.sleep(0)
+            with self.assertRaises(AdmissionRejected) as context:
+                await controller.acquire("get_categories")
+            self.assertGreaterEqual(context.exception.retry_after, 1)
+            self.assertEqual(controller.stats()["rejected"], 1)
+            waiting.cancel()
+            await asyncio.gather(waiting, return_exceptions=True)
+            self.assertEqual(controller.queue_depth(), 0)
+
+        asyncio.run(run())
+
+    def test_stats(self):
+        """
+        Test that stats report admissions and wait times.
+        """
+
+        async def run():
+            controller = AdmissionController()
+            await controller.acquire("get_categories")
+            controller.release("get_categories", 0.05)
+            return controller.stats()
+
+        stats = asyncio.run(run())
+        self.assertEqual(stats["admitted"], 1)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertGreater(stats["avg_service_ms"], 0)
+
+    def test_middleware_rejection(self):
+        """
+        Test that a rejected call returns an error result with retry_after.
+        """
+        mcp = FastMCP(name="TestServer")
+
+        @mcp.tool()
+        def echo(value: str) -> dict:
+            return {"value": value}
+
+        controller = admission.register(mcp)
+        controller.max_concurrency = 0
+        controller.max_queue_depth = 0
+
+        async def run():
+            async with Client(mcp) as client:
+                return await client.call_tool("echo", {"value": "x"})
+
+        with self.assertRaises(ToolError) as context:
+            asyncio.run(run())
+        self.assertIn("Retry after", str(context.exception))
+
+    def test_register(self):
+        """
+        Test that register adds the middleware and the /admission route.
+        """
+        mock_mcp = MagicMock()
+
+        controller = admission.register(mock_mcp)
+
+        self.assertIsInstance(controller, AdmissionController)
+        mock_mcp.add_middleware.assert_called_once()
+        mock_mcp.custom_route.assert_called_once_with("/admission", methods=["GET"])
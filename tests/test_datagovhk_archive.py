@@ -0,0 +1,242 @@
+"""
+Module for testing the datagovhk_archive tools.
+"""
+
+import unittest
+from datetime import date
+from unittest.mock import patch, MagicMock
+
+import requests
+
+from hkopenai.hk_datagovhk_mcp_server.tools import archive
+from hkopenai.hk_datagovhk_mcp_server.tools.archive import (
+    _get_archived_file,
+    _list_archived_versions,
+    register,
+)
+
+RESOURCE_URL = "https://data.gov.hk/resource.csv"
+
+
+def _fake_versions(url, params=None, timeout=None):
+    """Return version timestamps on the first and 15th of each requested month."""
+    month = params["start"][:6]
+    return {"version-count": 2, "timestamps": [f"{month}01-0900", f"{month}15-0900"]}
+
+
+class TestDatagovhkArchive(unittest.TestCase):
+    """
+    Test class for verifying datagovhk_archive functionality.
+
+    This class contains test cases to ensure archived version listings are split,
+    merged and cached, and archived files are fetched as expected.
+    """
+
+    def setUp(self):
+        archive._listing_cache.clear()  # pylint: disable=protected-access
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.archive.fetch_json_data")
+    def test_list_archived_versions_splits_range(self, mock_fetch_json_data):
+        """
+        Test that a year is fetched as monthly chunks and merged in order.
+        """
+        mock_fetch_json_data.side_effect = _fake_versions
+
+        result = _list_archived_versions(RESOURCE_URL, "20230101", "20231231")
+
+        self.assertEqual(mock_fetch_json_data.call_count, 12)
+        self.assertEqual(result["version-count"], 24)
+        self.assertEqual(result["timestamps"][0], "20230101-0900")
+        self.assertEqual(result["timestamps"], sorted(result["timestamps"]))
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.archive.fetch_json_data")
+    def test_past_listings_are_cached(self, mock_fetch_json_data):
+        """
+        Test that listings for past dates are only fetched once.
+        """
+        mock_fetch_json_data.side_effect = _fake_versions
+
+        first = _list_archived_versions(RESOURCE_URL, "20230101", "20230131")
+        second = _list_archived_versions(RESOURCE_URL, "20230101", "20230131")
+
+        self.assertEqual(mock_fetch_json_data.call_count, 1)
+        self.assertEqual(first, second)
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.archive.fetch_json_data")
+    def test_current_listings_are_not_cached(self, mock_fetch_json_data):
+        """
+        Test that listings reaching today are fetched again.
+        """
+        mock_fetch_json_data.side_effect = _fake_versions
+        today = date.today()
+        start = today.replace(day=1).strftime("%Y%m%d")
+        end = today.strftime("%Y%m%d")
+
+        _list_archived_versions(RESOURCE_URL, start, end)
+        _list_archived_versions(RESOURCE_URL, start, end)
+
+        self.assertEqual(mock_fetch_json_data.call_count, 2)
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.archive.fetch_json_data")
+    def test_months_are_aligned_and_filtered(self, mock_fetch_json_data):
+        """
+        Test that shifted ranges reuse cached months and are filtered to the range.
+        """
+        mock_fetch_json_data.side_effect = _fake_versions
+
+        first = _list_archived_versions(RESOURCE_URL, "20230101", "20230131")
+        shifted = _list_archived_versions(RESOURCE_URL, "20230102", "20230201")
+
+        self.assertEqual(first["timestamps"], ["20230101-0900", "20230115-0900"])
+        self.assertEqual(shifted["timestamps"], ["20230115-0900", "20230201-0900"])
+        params = [call.kwargs["params"] for call in mock_fetch_json_data.call_args_list]
+        self.assertEqual(
+            sorted((p["start"], p["end"]) for p in params),
+            [("20230101", "20230131"), ("20230201", "20230228")],
+        )
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.archive.fetch_json_data")
+    def test_list_archived_versions_span_limit(self, mock_fetch_json_data):
+        """
+        Test that ranges spanning too many months are rejected without fetching.
+        """
+        result = _list_archived_versions(RESOURCE_URL, "00010101", "99991231")
+
+        self.assertIn("at most 36 months", result["error"])
+        mock_fetch_json_data.assert_not_called()
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.archive.MAX_CACHED_LISTINGS", 2)
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.archive.fetch_json_data")
+    def test_listing_cache_is_bounded(self, mock_fetch_json_data):
+        """
+        Test that the listing cache evicts the least recently used months.
+        """
+        mock_fetch_json_data.side_effect = _fake_versions
+
+        _list_archived_versions(RESOURCE_URL, "20230101", "20230331")
+
+        self.assertEqual(
+            list(archive._listing_cache),  # pylint: disable=protected-access
+            [(RESOURCE_URL, "202302"), (RESOURCE_URL, "202303")],
+        )
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.archive.fetch_json_data")
+    def test_list_archived_versions_error(self, mock_fetch_json_data):
+        """
+        Test that upstream errors are returned and not cached.
+        """
+        mock_fetch_json_data.return_value = {"error": "HTTP error occurred"}
+
+        result = _list_archived_versions(RESOURCE_URL, "20230101", "20230131")
+        _list_archived_versions(RESOURCE_URL, "20230101", "20230131")
+
+        self.assertEqual(result, {"error": "HTTP error occurred"})
+        self.assertEqual(mock_fetch_json_data.call_count, 2)
+
+    def test_list_archived_versions_invalid_dates(self):
+        """
+        Test handling of malformed and reversed date ranges.
+        """
+        self.assertIn(
+            "error", _list_archived_versions(RESOURCE_URL, "2023", "20230131")
+        )
+        self.assertIn(
+            "error", _list_archived_versions(RESOURCE_URL, "20230201", "20230101")
+        )
+        for unpadded in ("2023111", "2023-1-1", "２０２３１１０１"):
+            self.assertIn(
+                "YYYYMMDD",
+                _list_archived_versions(RESOURCE_URL, unpadded, "20231130")["error"],
+            )
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.archive.fetch")
+    def test_get_archived_file(self, mock_get):
+        """
+        Test fetching JSON and non-JSON archived files.
+        """
+        mock_response = MagicMock()
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.encoding = "utf-8"
+        mock_response.content = b'\xef\xbb\xbf{"value": 1}'
+        mock_get.return_value = mock_response
+
+        result = _get_archived_file(RESOURCE_URL, "20230101-0900")
+        self.assertEqual(result["data"], {"value": 1})
+        mock_get.assert_called_once_with(
+            archive.GET_FILE_URL,
+            params={"url": RESOURCE_URL, "time": "20230101-0900"},
+            timeout=30,
+        )
+
+        mock_response.content = b"a,b\n1,2\n"
+        result = _get_archived_file(RESOURCE_URL, "20230101-0900")
+        self.assertEqual(result["content"], "a,b\n1,2\n")
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.archive.fetch")
+    def test_get_archived_file_decodes_utf8_text(self, mock_get):
+        """
+        Test that text/csv without a charset is decoded as UTF-8, not ISO-8859-1.
+        """
+        mock_response = MagicMock()
+        mock_response.headers = {"Content-Type": "text/csv"}
+        mock_response.encoding = "ISO-8859-1"
+        mock_response.content = "\ufeff地區,數值\n中西區,1\n".encode("utf-8")
+        mock_get.return_value = mock_response
+
+        result = _get_archived_file(RESOURCE_URL, "20230101-0900")
+        self.assertEqual(result["content"], "地區,數值\n中西區,1\n")
+
+        mock_response.headers = {"Content-Type": "text/csv; charset=Big5"}
+        mock_response.content = "中西區".encode("big5")
+        result = _get_archived_file(RESOURCE_URL, "20230101-0900")
+        self.assertEqual(result["content"], "中西區")
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.archive.fetch")
+    def test_get_archived_file_http_error(self, mock_get):
+        """
+        Test handling of HTTP errors during archived file fetching.
+        """
+        mock_get.return_value.raise_for_status.side_effect = (
+            requests.exceptions.HTTPError("Not Found")
+        )
+
+        result = _get_archived_file(RESOURCE_URL, "20230101-0900")
+        self.assertIn("Failed to fetch archived file", result["error"])
+
+    def test_register_tool(self):
+        """
+        Test the registration of the archive tools.
+
+        This test verifies that the register function registers both tools and that
+        they call the underlying functions.
+        """
+        mock_mcp = MagicMock()
+
+        register(mock_mcp)
+
+        self.assertEqual(mock_mcp.tool.call_count, 2)
+        decorated_functions = [
+            call[0][0] for call in mock_mcp.tool.return_value.call_args_list
+        ]
+        self.assertEqual(
+            [function.__name__ for function in decorated_functions],
+            ["list_archived_versions", "get_archived_file"],
+        )
+
+        with patch(
+            "hkopenai.hk_datagovhk_mcp_server.tools.archive._list_archived_versions"
+        ) as mock_list_archived_versions:
+            decorated_functions[0](
+                resource_url=RESOURCE_URL, start_date="20230101", end_date="20230131"
+            )
+            mock_list_archived_versions.assert_called_once_with(
+                RESOURCE_URL, "20230101", "20230131"
+            )
+
+        with patch(
+            "hkopenai.hk_datagovhk_mcp_server.tools.archive._get_archived_file"
+        ) as mock_get_archived_file:
+            decorated_functions[1](resource_url=RESOURCE_URL, version="20230101-0900")
+            mock_get_archived_file.assert_called_once_with(
+                RESOURCE_URL, "20230101-0900"
+            )
@@ -0,0 +1,292 @@
+"""
+Module for testing server-side result cursors.
+"""
+
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from fastmcp import Client, FastMCP
+
+from hkopenai.hk_datagovhk_mcp_server.cursors import CursorStore, collection_path
+from hkopenai.hk_datagovhk_mcp_server.response_cache import ResponseCache
+from hkopenai.hk_datagovhk_mcp_server.tools import categories, package, providers
+
+PACKAGE = {
+    "success": True,
+    "result": {
+        "id": "test_id",
+        "resources": [{"id": f"resource-{i}"} for i in range(5)],
+    },
+}
+
+
+class TestCursorStore(unittest.TestCase):
+    """
+    Test class for verifying CursorStore functionality.
+
+    This class contains test cases to ensure results are paged, buffered and
+    evicted as expected.
+    """
+
+    def test_pages_nested_list(self):
+        """
+        Test paging through a nested list until the cursor runs out.
+        """
+        store = CursorStore(ttl=60)
+
+        page = store.open(PACKAGE, ("result", "resources"), 2)
+        ids = [r["id"] for r in page["result"]["resources"]]
+        while page["pagination"]["next_cursor"]:
+            page = store.read(page["pagination"]["next_cursor"])
+            ids.extend(r["id"] for r in page["result"]["resources"])
+
+        self.assertEqual(ids, [f"resource-{i}" for i in range(5)])
+        self.assertEqual(page["pagination"]["total"], 5)
+        self.assertEqual(page["result"]["id"], "test_id")
+        self.assertEqual(len(PACKAGE["result"]["resources"]), 5)
+
+    def test_pages_top_level_list(self):
+        """
+        Test that a top-level list is paged under an items key.
+        """
+        store = CursorStore(ttl=60)
+
+        page = store.open(["a", "b", "c"], (), 2)
+        self.assertEqual(page["items"], ["a", "b"])
+        self.assertEqual(store.read(page["pagination"]["next_cursor"])["items"], ["c"])
+
+    def test_pages_mapping_items(self):
+        """
+        Test that a mapping is paged by its items in insertion order.
+        """
+        store = CursorStore(ttl=60)
+        mapping = {f"provider-{i}": f"Provider {i}" for i in range(3)}
+
+        page = store.open(mapping, (), 2)
+        self.assertEqual(list(page["items"]), ["provider-0", "provider-1"])
+        last = store.read(page["pagination"]["next_cursor"])
+        self.assertEqual(last["items"], {"provider-2": "Provider 2"})
+        self.assertEqual(last["pagination"]["total"], 3)
+
+    def test_collection_path(self):
+        """
+        Test that the collection key is used only when it holds a collection.
+        """
+        self.assertEqual(
+            collection_path({"categories": []}, "categories"), ("categories",)
+        )
+        self.assertEqual(collection_path({"a": "b"}, "categories"), ())
+        self.assertEqual(collection_path({"categories": "x"}, "categories"), ())
+
+    def test_pages_cached_tool_result(self):
+        """
+        Test that a pre-serialized ToolResult from the response cache is paged.
+        """
+        store = CursorStore(ttl=60)
+        result = ResponseCache(ttl=60).get_or_fetch("key", lambda: PACKAGE)
+
+        page = store.open(result, ("result", "resources"), 4)
+        self.assertEqual(len(page["result"]["resources"]), 4)
+        self.assertEqual(page["pagination"]["total"], 5)
+
+    def test_errors_are_returned_unchanged(self):
+        """
+        Test that results without a list to page are returned unchanged.
+        """
+        store = CursorStore(ttl=60)
+        error = {"error": "HTTP error occurred"}
+        self.assertIs(store.open(error, ("result", "resources"), 2), error)
+        self.assertIs(store.open(error, (), 2), error)
+
+    def test_expired_and_invalid_cursors(self):
+        """
+        Test that expired, evicted and malformed cursors return errors.
+        """
+        store = CursorStore(ttl=0.01, maxsize=1)
+        cursor = store.open(PACKAGE, ("result", "resources"), 2)["pagination"][
+            "next_cursor"
+        ]
+        time.sleep(0.02)
+        self.assertIn("error", store.read(cursor))
+        self.assertIn("error", store.read("not-a-cursor"))
+
+        store.ttl = 60
+        first = store.open(PACKAGE, ("result", "resources"), 2)
+        store.open(PACKAGE, ("result", "resources"), 2)
+        self.assertIn("error", store.read(first["pagination"]["next_cursor"]))
+
+    def test_malformed_offset_keeps_buffer(self):
+        """
+        Test that a cursor with a malformed offset does not evict its buffer.
+        """
+        store = CursorStore(ttl=60)
+        cursor = store.open(PACKAGE, ("result", "resources"), 2)["pagination"][
+            "next_cursor"
+        ]
+        token = cursor.rpartition(".")[0]
+
+        self.assertIn("error", store.read(f"{token}.abc"))
+        self.assertIn("error", store.read(f"{token}."))
+        self.assertIn("error", store.read(f"{token}.²"))
+        self.assertIn("error", store.read(f"{token}.٣"))
+        self.assertNotIn("error", store.read(cursor))
+
+    def test_cursor_bound_to_key(self):
+        """
+        Test that a cursor is rejected for different call arguments.
+        """
+        store = CursorStore(ttl=60)
+        key = ("get_package_data", "A", "en")
+        cursor = store.open(PACKAGE, ("result", "resources"), 2, key)["pagination"][
+            "next_cursor"
+        ]
+
+        mismatch = store.read(cursor, ("get_package_data", "B", "en"))
+        self.assertIn("different arguments", mismatch["error"])
+        self.assertEqual(len(store.read(cursor, key)["result"]["resources"]), 2)
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.package._get_package_data")
+    def test_get_package_data_cursor(self, mock_get_package_data):
+        """
+        Test that later pages are read without calling the upstream again.
+        """
+        mock_get_package_data.return_value = PACKAGE
+        mcp = FastMCP(name="TestServer")
+        package.register(mcp)
+
+        async def run():
+            async with Client(mcp) as client:
+                first = await client.call_tool(
+                    "get_package_data", {"package_id": "test_id", "page_size": 3}
+                )
+                cursor = first.structured_content["pagination"]["next_cursor"]
+                second = await client.call_tool(
+                    "get_package_data", {"package_id": "test_id", "cursor": cursor}
+                )
+                return first.structured_content, second.structured_content
+
+        first, second = asyncio.run(run())
+        self.assertEqual(len(first["result"]["resources"]), 3)
+        self.assertEqual(len(second["result"]["resources"]), 2)
+        self.assertIsNone(second["pagination"]["next_cursor"])
+        mock_get_package_data.assert_called_once_with("test_id", "en")
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.package._get_package_data")
+    def test_get_package_data_cursor_other_package(self, mock_get_package_data):
+        """
+        Test that a cursor for one package is not served for another.
+        """
+        mock_get_package_data.return_value = PACKAGE
+        mcp = FastMCP(name="TestServer")
+        package.register(mcp)
+
+        async def run():
+            async with Client(mcp) as client:
+                first = await client.call_tool(
+                    "get_package_data", {"package_id": "A", "page_size": 2}
+                )
+                cursor = first.structured_content["pagination"]["next_cursor"]
+                other = await client.call_tool(
+                    "get_package_data", {"package_id": "B", "cursor": cursor}
+                )
+                return other.structured_content
+
+        other = asyncio.run(run())
+        self.assertIn("different arguments", other["error"])
+        mock_get_package_data.assert_called_once_with("A", "en")
+
+
+def _page_through(mcp, tool, page_size):
+    """Call tool with page_size and follow next_cursor, returning every page."""
+
+    async def run():
+        async with Client(mcp) as client:
+            result = await client.call_tool(tool, {"page_size": page_size})
+            pages = [result.structured_content]
+            while pages[-1]["pagination"]["next_cursor"]:
+                cursor = pages[-1]["pagination"]["next_cursor"]
+                result = await client.call_tool(tool, {"cursor": cursor})
+                pages.append(result.structured_content)
+            return pages
+
+    return asyncio.run(run())
+
+
+class TestCatalogueCursors(unittest.TestCase):
+    """
+    Test class for verifying paging of the categories and providers tools.
+
+    This class contains test cases to ensure each upstream response shape is paged
+    by its real collection and served from the response cache.
+    """
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.categories.fetch_json_data")
+    def test_get_categories_keyed_list(self, mock_fetch_json_data):
+        """
+        Test that categories under a categories key are paged in place.
+        """
+        mock_fetch_json_data.return_value = {
+            "categories": [f"Category{i}" for i in range(5)]
+        }
+        mcp = FastMCP(name="TestServer")
+        categories.register(mcp)
+
+        pages = _page_through(mcp, "get_categories", 2)
+        self.assertEqual([len(page["categories"]) for page in pages], [2, 2, 1])
+        self.assertEqual(pages[0]["pagination"]["total"], 5)
+
+        _page_through(mcp, "get_categories", 2)
+        mock_fetch_json_data.assert_called_once()
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.categories.fetch_json_data")
+    def test_get_categories_bare_list(self, mock_fetch_json_data):
+        """
+        Test that a bare list of categories is wrapped, cached and paged.
+        """
+        mock_fetch_json_data.return_value = [{"id": i} for i in range(3)]
+        mcp = FastMCP(name="TestServer")
+        categories.register(mcp)
+
+        pages = _page_through(mcp, "get_categories", 2)
+        self.assertEqual(
+            [c["id"] for page in pages for c in page["categories"]], [0, 1, 2]
+        )
+
+        _page_through(mcp, "get_categories", 2)
+        mock_fetch_json_data.assert_called_once()
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.providers.fetch_json_data")
+    def test_get_providers_mapping(self, mock_fetch_json_data):
+        """
+        Test that a flat mapping of providers is paged by its items.
+        """
+        mock_fetch_json_data.return_value = {
+            f"provider-{i}": f"Provider {i}" for i in range(3)
+        }
+        mcp = FastMCP(name="TestServer")
+        providers.register(mcp)
+
+        pages = _page_through(mcp, "get_providers", 2)
+        self.assertEqual(
+            [key for page in pages for key in page["items"]],
+            ["provider-0", "provider-1", "provider-2"],
+        )
+
+        _page_through(mcp, "get_providers", 2)
+        mock_fetch_json_data.assert_called_once()
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.providers.fetch_json_data")
+    def test_get_providers_keyed_list(self, mock_fetch_json_data):
+        """
+        Test that providers under a providers key are paged in place.
+        """
+        mock_fetch_json_data.return_value = {
+            "providers": [{"id": i} for i in range(4)]
+        }
+        mcp = FastMCP(name="TestServer")
+        providers.register(mcp)
+
+        pages = _page_through(mcp, "get_providers", 3)
+        self.assertEqual([len(page["providers"]) for page in pages], [3, 1])
@@ -0,0 +1,200 @@
+"""
+Module for testing the datagovhk_related tool.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+from hkopenai.hk_datagovhk_mcp_server.tools.related import (
+    RELATED_INDEX_ENV,
+    _find_related_datasets,
+    _tokenize,
+    build_index,
+    load_index,
+    main,
+    register,
+)
+
+PACKAGES = {
+    "air-quality": ("Air Quality Health Index", "Hourly air pollution", ["air"]),
+    "air-pollutants": ("Air Pollutants", "Air pollution by station", ["air"]),
+    "bus-routes": ("Bus Routes", "Franchised bus route info", ["transport"]),
+    "minibus-routes": ("Minibus Routes", "Green minibus route info", ["transport"]),
+    "error-package": None,
+}
+
+
+def _fake_fetch(package_id, language):
+    """Return a package_show-like response for the fake packages."""
+    package = PACKAGES[package_id]
+    if package is None:
+        return {"error": "HTTP error occurred"}
+    title, notes, tags = package
+    return {
+        "result": {
+            "title": title,
+            "notes": notes,
+            "tags": [{"name": tag} for tag in tags],
+        }
+    }
+
+
+class TestDatagovhkRelated(unittest.TestCase):
+    """
+    Test class for verifying datagovhk_related functionality.
+
+    This class contains test cases to ensure the index is built, persisted, loaded
+    and queried as expected.
+    """
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.count = build_index(PACKAGES, self.tmpdir.name, fetch=_fake_fetch)
+        self.index = load_index(self.tmpdir.name)
+
+    def tearDown(self):
+        del self.index
+        self.tmpdir.cleanup()
+
+    def test_build_index_skips_errors(self):
+        """
+        Test that packages returning errors are not indexed.
+        """
+        self.assertEqual(self.count, 4)
+        self.assertNotIn("error-package", self.index.package_ids)
+
+    def test_find_related_datasets(self):
+        """
+        Test that the most similar package is ranked first.
+        """
+        result = _find_related_datasets(self.index, "bus-routes", k=2)
+        self.assertEqual(result["package_id"], "bus-routes")
+        self.assertEqual(len(result["related"]), 2)
+        self.assertEqual(result["related"][0]["package_id"], "minibus-routes")
+        self.assertEqual(result["related"][0]["title"], "Minibus Routes")
+        self.assertGreater(
+            result["related"][0]["score"], result["related"][1]["score"]
+        )
+
+    def test_find_related_datasets_excludes_self(self):
+        """
+        Test that the queried package is never returned and k is capped.
+        """
+        result = _find_related_datasets(self.index, "air-quality", k=10)
+        related_ids = [item["package_id"] for item in result["related"]]
+        self.assertEqual(len(related_ids), 3)
+        self.assertNotIn("air-quality", related_ids)
+
+    def test_find_related_datasets_unknown_package(self):
+        """
+        Test handling of packages missing from the index.
+        """
+        result = _find_related_datasets(self.index, "unknown", k=5)
+        self.assertIn("error", result)
+
+    def test_find_related_datasets_without_index(self):
+        """
+        Test handling of a missing index.
+        """
+        result = _find_related_datasets(None, "bus-routes", k=5)
+        self.assertIn("error", result)
+        self.assertIn(RELATED_INDEX_ENV, result["error"])
+
+    def test_tokenize_cjk_bigrams(self):
+        """
+        Test that CJK runs are split into character bigrams and words are kept.
+        """
+        self.assertEqual(
+            _tokenize("空氣質素 每小時 AQHI數據"),
+            ["空氣", "氣質", "質素", "每小", "小時", "aqhi", "數據"],
+        )
+
+    def test_find_related_datasets_chinese(self):
+        """
+        Test that an index of Traditional Chinese packages ranks related datasets.
+        """
+        packages = {
+            "air-quality": ("空氣質素健康指數", "每小時空氣污染數據", []),
+            "air-pollutants": ("空氣污染物濃度", "各監測站空氣污染數據", []),
+            "bus-routes": ("巴士路線", "專營巴士路線資料", []),
+            "minibus-routes": ("小巴路線", "綠色專線小巴路線資料", []),
+        }
+
+        def fetch(package_id, language):
+            title, notes, _ = packages[package_id]
+            return {"result": {"title": title, "notes": notes, "tags": []}}
+
+        with tempfile.TemporaryDirectory() as index_dir:
+            build_index(packages, index_dir, language="tc", fetch=fetch)
+            index = load_index(index_dir)
+            result = _find_related_datasets(index, "bus-routes", k=1)
+            del index
+
+        self.assertEqual(result["related"][0]["package_id"], "minibus-routes")
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.related.build_index")
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.related._list_package_ids")
+    def test_main_indexes_all_packages(self, mock_list_package_ids, mock_build_index):
+        """
+        Test that --all builds the index from the package_list catalogue.
+        """
+        mock_list_package_ids.return_value = {
+            "success": True,
+            "result": ["air-quality", "bus-routes"],
+        }
+        mock_build_index.return_value = 2
+
+        main(["--all", "bus-routes", "-o", self.tmpdir.name, "-l", "tc"])
+
+        mock_list_package_ids.assert_called_once_with("tc")
+        self.assertEqual(
+            mock_build_index.call_args[0][:3],
+            (["bus-routes", "air-quality"], self.tmpdir.name, "tc"),
+        )
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.related.build_index")
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.related._list_package_ids")
+    def test_main_listing_error(self, mock_list_package_ids, mock_build_index):
+        """
+        Test that a failed package listing exits without building an index.
+        """
+        mock_list_package_ids.return_value = {"error": "HTTP error occurred"}
+
+        with self.assertRaises(SystemExit) as context:
+            main(["--all", "-o", self.tmpdir.name])
+
+        self.assertEqual(context.exception.code, 1)
+        mock_build_index.assert_not_called()
+
+    def test_register_tool(self):
+        """
+        Test the registration of the find_related_datasets tool.
+
+        This test verifies that the register function loads the index from the
+        configured directory and that the registered tool calls the underlying
+        _find_related_datasets function.
+        """
+        mock_mcp = MagicMock()
+
+        with patch.dict(os.environ, {RELATED_INDEX_ENV: self.tmpdir.name}):
+            register(mock_mcp)
+
+        mock_mcp.tool.assert_called_once_with(
+            description=(
+                "Find datasets related to a data.gov.hk package by similarity of their "
+                "titles, descriptions and tags."
+            ),
+        )
+        decorated_function = mock_mcp.tool.return_value.call_args[0][0]
+        self.assertEqual(decorated_function.__name__, "find_related_datasets")
+
+        with patch(
+            "hkopenai.hk_datagovhk_mcp_server.tools.related._find_related_datasets"
+        ) as mock_find_related_datasets:
+            decorated_function(package_id="bus-routes", k=3)
+            index = mock_find_related_datasets.call_args[0][0]
+            self.assertEqual(index.package_ids, self.index.package_ids)
+            mock_find_related_datasets.assert_called_once_with(index, "bus-routes", 3)
@@ -0,0 +1,223 @@
+"""
+Module for testing the pre-serialized response cache.
+
+This module also contains microbenchmarks, deselected by default, comparing the JSON
+encoders and FastMCP's default conversion of a large result with a cache hit.
+"""
+
+import asyncio
+import json
+import time
+import unittest
+from typing import Dict
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.tools import FunctionTool, ToolResult
+
+from hkopenai.hk_datagovhk_mcp_server.response_cache import ResponseCache, dumps
+from hkopenai.hk_datagovhk_mcp_server.tools import categories, package
+
+
+def _large_payload() -> Dict:
+    """Build a payload shaped like a large package_show response."""
+    return {
+        "success": True,
+        "result": {
+            "id": "hk-dummy-package",
+            "title": "Dummy package",
+            "tags": [
+                {"name": f"tag-{i}", "display_name": f"Tag {i}"} for i in range(50)
+            ],
+            "resources": [
+                {
+                    "id": f"resource-{i}",
+                    "name": f"Resource {i} 資源",
+                    "url": f"https://data.gov.hk/resource/{i}.csv",
+                    "format": "CSV",
+                    "description": "A resource description " * 5,
+                }
+                for i in range(1000)
+            ],
+        },
+    }
+
+
+class TestResponseCache(unittest.TestCase):
+    """
+    Test class for verifying ResponseCache functionality.
+    """
+
+    def test_dumps_round_trip(self):
+        """
+        Test that dumps produces JSON equal to the input.
+        """
+        payload = _large_payload()
+        self.assertEqual(json.loads(dumps(payload)), payload)
+
+    def test_cache_hit_reuses_result(self):
+        """
+        Test that a repeated call returns the same pre-serialized ToolResult.
+        """
+        cache = ResponseCache(ttl=60)
+        fetch = MagicMock(return_value={"categories": ["Category1"]})
+
+        first = cache.get_or_fetch(("get_categories", "en"), fetch)
+        second = cache.get_or_fetch(("get_categories", "en"), fetch)
+
+        fetch.assert_called_once()
+        self.assertIs(first, second)
+        self.assertIsInstance(first, ToolResult)
+        self.assertEqual(first.structured_content, {"categories": ["Category1"]})
+        self.assertEqual(
+            json.loads(first.content[0].text), {"categories": ["Category1"]}
+        )
+
+    def test_errors_are_not_cached(self):
+        """
+        Test that error responses are returned unchanged and not cached.
+        """
+        cache = ResponseCache(ttl=60)
+        fetch = MagicMock(return_value={"error": "HTTP error occurred"})
+
+        result = cache.get_or_fetch("key", fetch)
+        cache.get_or_fetch("key", fetch)
+
+        self.assertEqual(result, {"error": "HTTP error occurred"})
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_expired_entries_are_refetched(self):
+        """
+        Test that entries older than the TTL are fetched again.
+        """
+        cache = ResponseCache(ttl=0.01)
+        fetch = MagicMock(return_value={"result": 1})
+
+        cache.get_or_fetch("key", fetch)
+        time.sleep(0.02)
+        cache.get_or_fetch("key", fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_maxsize_evicts_least_recently_used(self):
+        """
+        Test that the cache evicts the least recently used entry when full.
+        """
+        cache = ResponseCache(ttl=60, maxsize=2)
+        fetch = MagicMock(side_effect=lambda: {"result": fetch.call_count})
+
+        cache.get_or_fetch("a", fetch)
+        cache.get_or_fetch("b", fetch)
+        cache.get_or_fetch("a", fetch)
+        cache.get_or_fetch("c", fetch)
+        cache.get_or_fetch("a", fetch)
+        cache.get_or_fetch("b", fetch)
+
+        self.assertEqual(fetch.call_count, 4)
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.response_cache.dumps")
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.categories.fetch_json_data")
+    def test_get_categories_passes_cached_result_through(
+        self, mock_fetch_json_data, mock_dumps
+    ):
+        """
+        Test that FastMCP returns the pre-serialized text of a cached result unchanged.
+
+        The patched dumps produces indented JSON, which FastMCP never emits itself,
+        so matching text shows the cached ToolResult was not re-serialized.
+        """
+        mock_fetch_json_data.return_value = {"categories": ["Category1", "類別"]}
+        mock_dumps.side_effect = lambda data: json.dumps(
+            data, indent=1, ensure_ascii=False
+        ).encode("utf-8")
+        expected = mock_dumps.side_effect(mock_fetch_json_data.return_value).decode()
+        mcp = FastMCP(name="TestServer")
+        categories.register(mcp)
+
+        results = asyncio.run(_call_twice(mcp, "get_categories", {"language": "en"}))
+
+        mock_fetch_json_data.assert_called_once()
+        mock_dumps.assert_called_once()
+        for result in results:
+            self.assertEqual(result.content[0].text, expected)
+            self.assertEqual(
+                result.structured_content, mock_fetch_json_data.return_value
+            )
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.response_cache.dumps")
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.package.fetch_json_data")
+    def test_get_package_data_passes_cached_result_through(
+        self, mock_fetch_json_data, mock_dumps
+    ):
+        """
+        Test that repeated package lookups reuse the cached pre-serialized text.
+        """
+        payload = _large_payload()
+        mock_fetch_json_data.return_value = payload
+        mock_dumps.side_effect = lambda data: json.dumps(data, indent=1).encode()
+        expected = json.dumps(payload, indent=1)
+        mcp = FastMCP(name="TestServer")
+        package.register(mcp)
+
+        results = asyncio.run(
+            _call_twice(mcp, "get_package_data", {"package_id": "hk-dummy-package"})
+        )
+
+        mock_fetch_json_data.assert_called_once()
+        for result in results:
+            self.assertEqual(result.content[0].text, expected)
+            self.assertEqual(result.structured_content, payload)
+
+
+async def _call_twice(mcp, tool, arguments):
+    """Call a tool twice through an in-memory client and return both results."""
+    async with Client(mcp) as client:
+        return [await client.call_tool(tool, arguments) for _ in range(2)]
+
+
+@pytest.mark.benchmark
+class TestResponseCacheBenchmark(unittest.TestCase):
+    """
+    Microbenchmarks for the response cache, reporting timings without asserting.
+
+    These are deselected by default; run them with: pytest -m benchmark -s
+    """
+
+    iterations = 20
+
+    def _time(self, func) -> float:
+        start = time.perf_counter()
+        for _ in range(self.iterations):
+            func()
+        return (time.perf_counter() - start) * 1000 / self.iterations
+
+    def test_benchmark_encoders(self):
+        """
+        Compare the orjson encoder with the standard library json fallback.
+        """
+        payload = _large_payload()
+        with patch("hkopenai.hk_datagovhk_mcp_server.response_cache.orjson", None):
+            stdlib_ms = self._time(lambda: dumps(payload))
+        orjson_ms = self._time(lambda: dumps(payload))
+        print(
+            f"\nstdlib json: {stdlib_ms:.3f} ms/call, orjson: {orjson_ms:.3f} ms/call"
+        )
+
+    def test_benchmark_cached_serialization(self):
+        """
+        Compare FastMCP's default conversion of a large result with a cache hit.
+        """
+        payload = _large_payload()
+
+        def get_package_data() -> Dict:
+            return payload
+
+        tool = FunctionTool.from_function(get_package_data)
+        cache = ResponseCache(ttl=60)
+
+        default_ms = self._time(lambda: tool.convert_result(payload))
+        cached_ms = self._time(
+            lambda: tool.convert_result(cache.get_or_fetch("package", lambda: payload))
+        )
+        print(f"\ndefault: {default_ms:.3f} ms/call, cached: {cached_ms:.3f} ms/call")
@@ -22,8 +22,14 @@ class TestApp(unittest.TestCase):
     @patch("hkopenai.hk_datagovhk_mcp_server.tools.providers.register")
     @patch("hkopenai.hk_datagovhk_mcp_server.tools.categories.register")
     @patch("hkopenai.hk_datagovhk_mcp_server.tools.package.register")
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.related.register")
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.archive.register")
+    @patch("hkopenai.hk_datagovhk_mcp_server.admission.register")
     def test_create_mcp_server(
         self,
+        mock_admission_register,
+        mock_archive_register,
+        mock_related_register,
         mock_package_register,
         mock_categories_register,
         mock_providers_register,
@@ -53,3 +59,6 @@ class TestApp(unittest.TestCase):
         mock_providers_register.assert_called_once_with(mock_server)
         mock_categories_register.assert_called_once_with(mock_server)
         mock_package_register.assert_called_once_with(mock_server)
+        mock_related_register.assert_called_once_with(mock_server)
+        mock_archive_register.assert_called_once_with(mock_server)
+        mock_admission_register.assert_called_once_with(mock_server)
@@ -0,0 +1,243 @@
+"""
+Module for testing the opt-in tracing support.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+from fastmcp import Client, FastMCP
+
+from hkopenai.hk_datagovhk_mcp_server import admission, tracing
+from hkopenai.hk_datagovhk_mcp_server.tools import categories
+
+_current_trace = tracing._current_trace  # pylint: disable=protected-access
+
+
+class TestDatagovhkTracing(unittest.TestCase):
+    """
+    Test class for verifying tracing functionality.
+
+    This class contains test cases to ensure spans, sampling, the ring buffer and
+    the debug_recent_traces tool work as expected.
+    """
+
+    def setUp(self):
+        tracing.configure(
+            enabled=True, sample_rate=1.0, buffer_size=3, profile_rate=1.0
+        )
+        tracing.clear()
+
+    def tearDown(self):
+        tracing.configure(
+            enabled=False,
+            sample_rate=1.0,
+            buffer_size=200,
+            profile_rate=tracing.DEFAULT_PROFILE_RATE,
+        )
+        tracing.clear()
+
+    def test_span_without_trace_is_noop(self):
+        """
+        Test that spans outside a sampled trace record nothing.
+        """
+        with tracing.span("upstream_fetch"):
+            pass
+        self.assertEqual(tracing.recent_traces(), [])
+
+    def test_ring_buffer_returns_slowest_first(self):
+        """
+        Test that the ring buffer is bounded and sorted by duration.
+        """
+        for duration in [5.0, 1.0, 9.0, 3.0]:
+            trace = tracing.Trace("tool")
+            trace.finish()
+            trace.duration_ms = duration
+            tracing.record(trace)
+
+        traces = tracing.recent_traces(limit=2)
+        self.assertEqual([t["duration_ms"] for t in traces], [9.0, 3.0])
+        self.assertEqual(len(tracing.recent_traces(limit=10)), 3)
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.categories.fetch_json_data")
+    def test_tool_call_records_spans(self, mock_fetch_json_data):
+        """
+        Test that a traced tool call records call_tool, tool and upstream spans.
+        """
+        mock_fetch_json_data.return_value = {"categories": ["Category1"]}
+        mcp = FastMCP(name="TestServer")
+        categories.register(mcp)
+        tracing.register(mcp)
+
+        async def run():
+            async with Client(mcp) as client:
+                await client.call_tool("get_categories", {"language": "en"})
+                return await client.call_tool("debug_recent_traces", {"limit": 5})
+
+        result = asyncio.run(run())
+        traces = result.structured_content["traces"]
+        self.assertEqual(len(traces), 1)
+        self.assertEqual(traces[0]["tool"], "get_categories")
+        span_names = {span["name"] for span in traces[0]["spans"]}
+        self.assertEqual(
+            span_names,
+            {"call_tool", "validation", "tool", "upstream_fetch", "serialization"},
+        )
+        self.assertIn("functions", traces[0]["profile"])
+
+    @patch("hkopenai.hk_datagovhk_mcp_server.tools.categories.fetch_json_data")
+    def test_framework_spans_surround_tool(self, mock_fetch_json_data):
+        """
+        Test that validation and serialization spans surround the tool span.
+        """
+        mock_fetch_json_data.return_value = {"categories": ["Category1"]}
+        mcp = FastMCP(name="TestServer")
+        categories.register(mcp)
+        tracing.register(mcp)
+        admission.register(mcp)
+
+        async def run():
+            async with Client(mcp) as client:
+                await client.call_tool("get_categories", {"language": "en"})
+
+        asyncio.run(run())
+        spans = {
+            span["name"]: (span["offset_ms"], span["offset_ms"] + span["duration_ms"])
+            for span in tracing.recent_traces()[0]["spans"]
+        }
+        self.assertLessEqual(
+            spans["admission_wait"][1], spans["validation"][0] + 0.001
+        )
+        self.assertLessEqual(spans["validation"][1], spans["tool"][0] + 0.001)
+        self.assertLessEqual(spans["tool"][1], spans["serialization"][0] + 0.001)
+        self.assertLessEqual(spans["serialization"][1], spans["call_tool"][1] + 0.001)
+
+    def test_overlapping_calls_profile_own_thread(self):
+        """
+        Test that overlapping sampled calls only profile their own thread's work.
+        """
+        started = threading.Event()
+        proceed = threading.Event()
+
+        def spin_slow():
+            while not proceed.is_set():
+                pass
+
+        def spin_fast(seconds):
+            deadline = time.perf_counter() + seconds
+            while time.perf_counter() < deadline:
+                pass
+
+        @tracing.traced
+        def slow_tool():
+            started.set()
+            spin_slow()
+            return "slow"
+
+        @tracing.traced
+        def fast_tool():
+            spin_fast(0.1)
+            return "fast"
+
+        slow_trace = tracing.Trace("slow_tool")
+        fast_trace = tracing.Trace("fast_tool")
+        results = []
+
+        def run_slow():
+            _current_trace.set(slow_trace)
+            results.append(slow_tool())
+
+        thread = threading.Thread(target=run_slow)
+        thread.start()
+        started.wait(timeout=5)
+        token = _current_trace.set(fast_trace)
+        try:
+            results.append(fast_tool())
+        finally:
+            _current_trace.reset(token)
+            proceed.set()
+            thread.join()
+
+        def sampled(trace):
+            return " ".join(f["function"] for f in trace.profile["functions"])
+
+        self.assertEqual(sorted(results), ["fast", "slow"])
+        self.assertIn("spin_fast", sampled(fast_trace))
+        self.assertNotIn("spin_slow", sampled(fast_trace))
+        self.assertIn("spin_slow", sampled(slow_trace))
+        self.assertNotIn("spin_fast", sampled(slow_trace))
+        self.assertEqual([span["name"] for span in fast_trace.spans], ["tool"])
+
+    @patch.object(tracing._StackSampler, "start")  # pylint: disable=protected-access
+    def test_profiler_failure_does_not_reach_tool(self, mock_start):
+        """
+        Test that a sampler that cannot start leaves the tool result intact.
+        """
+        mock_start.side_effect = RuntimeError("can't start new thread")
+        trace = tracing.Trace("tool")
+
+        @tracing.traced
+        def tool():
+            return "ok"
+
+        token = _current_trace.set(trace)
+        try:
+            self.assertEqual(tool(), "ok")
+            self.assertEqual(tool(), "ok")
+        finally:
+            _current_trace.reset(token)
+        self.assertIsNone(trace.profile)
+        self.assertEqual(len(trace.spans), 2)
+
+    def test_profile_rate_zero_records_spans_only(self):
+        """
+        Test that traced calls outside the profile rate record spans without a profile.
+        """
+        tracing.configure(enabled=True, profile_rate=0.0)
+        trace = tracing.Trace("tool")
+
+        @tracing.traced
+        def tool():
+            return "ok"
+
+        token = _current_trace.set(trace)
+        try:
+            self.assertEqual(tool(), "ok")
+        finally:
+            _current_trace.reset(token)
+        self.assertIsNone(trace.profile)
+        self.assertEqual([span["name"] for span in trace.spans], ["tool"])
+
+    def test_sample_rate_zero_skips_tracing(self):
+        """
+        Test that no traces are recorded when the sample rate is zero.
+        """
+        tracing.configure(enabled=True, sample_rate=0.0)
+        middleware = tracing.TracingMiddleware()
+        call_next = MagicMock()
+
+        async def fake_call_next(context):
+            call_next(context)
+            return "ok"
+
+        result = asyncio.run(middleware.on_call_tool(MagicMock(), fake_call_next))
+        self.assertEqual(result, "ok")
+        call_next.assert_called_once()
+        self.assertEqual(tracing.recent_traces(), [])
+
+    def test_register_tool(self):
+        """
+        Test the registration of the middleware and debug_recent_traces tool.
+        """
+        mock_mcp = MagicMock()
+
+        tracing.register(mock_mcp)
+
+        mock_mcp.add_middleware.assert_called_once()
+        mock_mcp.tool.assert_called_once_with(
+            description="Return the slowest recently traced tool calls with timed spans.",
+        )
+        decorated_function = mock_mcp.tool.return_value.call_args[0][0]
+        self.assertEqual(decorated_function.__name__, "debug_recent_traces")
@@ -0,0 +1,107 @@
+"""
+Module for testing upstream requests and their tracing spans.
+"""
+
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch
+
+from hkopenai.hk_datagovhk_mcp_server import tracing, upstream
+
+_current_trace = tracing._current_trace  # pylint: disable=protected-access
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve a small JSON document, or a 404 for /missing."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle GET requests."""
+        body = b'{"value": 1}'
+        self.send_response(404 if self.path == "/missing" else 200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Keep test output quiet."""
+
+
+class TestDatagovhkUpstream(unittest.TestCase):
+    """
+    Test class for verifying upstream requests.
+
+    This class contains test cases to ensure responses are fetched and decoded, and
+    that traced calls record each request phase as a span.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(("127.0.0.1", 0), _Handler)
+        cls.url = f"http://localhost:{cls.server.server_port}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_traced_fetch_records_phases(self):
+        """
+        Test that a traced fetch records DNS, connect, wait, download and decode.
+        """
+        trace = tracing.Trace("tool")
+        token = _current_trace.set(trace)
+        try:
+            result = upstream.fetch_json_data(f"{self.url}/data", timeout=5)
+        finally:
+            _current_trace.reset(token)
+
+        self.assertEqual(result, {"value": 1})
+        names = [span["name"] for span in trace.spans]
+        self.assertEqual(
+            names, ["dns", "tcp_connect", "upstream_wait", "download", "json_decode"]
+        )
+
+    def test_untraced_fetch_uses_requests_get(self):
+        """
+        Test that calls outside a trace go through requests.get unchanged.
+        """
+        with patch("requests.get", wraps=upstream.requests.get) as mock_get:
+            result = upstream.fetch_json_data(f"{self.url}/data", timeout=5)
+
+        self.assertEqual(result, {"value": 1})
+        mock_get.assert_called_once_with(
+            f"{self.url}/data", params=None, headers=None, timeout=5
+        )
+
+    def test_http_error(self):
+        """
+        Test that HTTP errors are returned as an error message.
+        """
+        trace = tracing.Trace("tool")
+        token = _current_trace.set(trace)
+        try:
+            result = upstream.fetch_json_data(f"{self.url}/missing", timeout=5)
+        finally:
+            _current_trace.reset(token)
+
+        self.assertIn("Status code: 404", result["error"])
+
+    def test_connection_error(self):
+        """
+        Test that connection failures are returned as an error message.
+        """
+        server = HTTPServer(("127.0.0.1", 0), _Handler)
+        port = server.server_port
+        server.server_close()
+        trace = tracing.Trace("tool")
+        token = _current_trace.set(trace)
+        try:
+            result = upstream.fetch_json_data(f"http://127.0.0.1:{port}/", timeout=5)
+        finally:
+            _current_trace.reset(token)
+
+        self.assertIn("Connection error occurred", result["error"])